@@ -107,28 +107,33 @@ def get_history(
         history = interaction_service.history_for_session(session_id=str(resolved["id"]), limit=limit)
         if not history:
             fallback = memory_service.get_history(user_id=user_id, limit=limit).get("history", [])
-            synthesized = []
+            # Filter and extract in one pass; rows without a summary dict have
+            # neither query nor response and would be dropped anyway.
+            entries: list[tuple[str, str, dict[str, object]]] = []
             for row in fallback:
                 if not isinstance(row, dict):
                     continue
-                summary = row.get("summary", {}) if isinstance(row.get("summary"), dict) else {}
+                summary = row.get("summary")
+                if not isinstance(summary, dict):
+                    continue
                 query = str(summary.get("query", "")).strip()
                 response = str(summary.get("response", "")).strip()
-                if not query and not response:
-                    continue
-                synthesized.append(
-                    {
-                        "id": f"memory_{len(synthesized)+1}",
-                        "sessionId": str(resolved["id"]),
-                        "userId": user_id,
-                        "message": query,
-                        "intent": str(row.get("type", "")),
-                        "agent": "memory",
-                        "response": {"message": response, "agent": "memory"},
-                        "timestamp": str(row.get("timestamp", "")),
-                    }
-                )
-            history = synthesized
+                if query or response:
+                    entries.append((query, response, row))
+            resolved_id = str(resolved["id"])
+            history = [
+                {
+                    "id": f"memory_{index}",
+                    "sessionId": resolved_id,
+                    "userId": user_id,
+                    "message": query,
+                    "intent": str(row.get("type", "")),
+                    "agent": "memory",
+                    "response": {"message": response, "agent": "memory"},
+                    "timestamp": str(row.get("timestamp", "")),
+                }
+                for index, (query, response, row) in enumerate(entries, start=1)
+            ]
         return {"sessionId": str(resolved["id"]), "messages": history}
 
     if not session_id:
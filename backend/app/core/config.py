@@ -58,6 +58,7 @@ class Settings:
     superu_webhook_tolerance_seconds: int = 300
     voice_recovery_scheduler_enabled: bool = False
     voice_recovery_scan_interval_seconds: float = 30.0
+    voice_poll_max_workers: int = 8
     voice_abandonment_minutes: int = 30
     voice_max_attempts_per_cart: int = 3
     voice_max_calls_per_user_per_day: int = 2
@@ -265,6 +266,9 @@ class Settings:
                     str(cls.voice_recovery_scan_interval_seconds),
                 )
             ),
+            voice_poll_max_workers=int(
+                os.getenv("VOICE_POLL_MAX_WORKERS", str(cls.voice_poll_max_workers))
+            ),
             voice_abandonment_minutes=int(
                 os.getenv("VOICE_ABANDONMENT_MINUTES", str(cls.voice_abandonment_minutes))
             ),
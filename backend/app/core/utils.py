@@ -1,6 +1,7 @@
 from __future__ import annotations
 import uuid
 from datetime import datetime, timezone, timedelta
+from typing import Any
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -8,10 +9,30 @@ def utc_now() -> datetime:
 def iso_now() -> str:
     return utc_now().isoformat()
 
+def day_bounds(now: datetime) -> tuple[str, str]:
+    """Returns the [start, end) ISO bounds of the UTC day containing ``now``.
+
+    Stored timestamps are UTC ``isoformat()`` strings, so a lexicographic range
+    over these bounds matches exactly the rows whose timestamp starts with
+    today's date.
+    """
+    today = now.date()
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
+
 def generate_id(prefix: str) -> str:
     """Generates a unique ID with the given prefix."""
     # Use 12 characters of UUID to be reasonably short but very unlikely to collide
     return f"{prefix}_{uuid.uuid4().hex[:12]}"
 
+def canon(value: Any) -> str:
+    """Returns a stored value as str, skipping the copy when it is already one.
+
+    Repository fields are written stripped, so str values pass through untouched;
+    anything else (None, numbers) is coerced and stripped.
+    """
+    if type(value) is str:
+        return value
+    return str(value or "").strip()
+
 def default_session_expiry(minutes: int = 30) -> str:
     return (utc_now() + timedelta(minutes=minutes)).isoformat()
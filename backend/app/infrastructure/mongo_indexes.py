@@ -51,12 +51,23 @@ MONGO_INDEX_SPECS: dict[str, list[IndexSpec]] = {
     "support_tickets": [
         ([("ticketId", ASCENDING)], {"name": "support_tickets_ticket_id_unique", "unique": True}),
         ([("status", ASCENDING), ("createdAt", DESCENDING)], {"name": "support_tickets_status_created_desc"}),
+        ([("status", ASCENDING), ("updatedAt", DESCENDING)], {"name": "support_tickets_status_updated_desc"}),
+        ([("status", ASCENDING), ("userId", ASCENDING), ("updatedAt", DESCENDING)], {"name": "support_tickets_status_user_updated_desc"}),
+        ([("status", ASCENDING), ("sessionId", ASCENDING), ("updatedAt", DESCENDING)], {"name": "support_tickets_status_session_updated_desc"}),
     ],
     "products": [
         ([("productId", ASCENDING)], {"name": "products_product_id_unique", "unique": True}),
         ([("name", ASCENDING)], {"name": "products_name_asc"}),
         ([("category", ASCENDING), ("price", ASCENDING)], {"name": "products_category_price_asc"}),
         ([("brand", ASCENDING), ("price", ASCENDING)], {"name": "products_brand_price_asc"}),
+        (
+            [("category", ASCENDING), ("price", ASCENDING)],
+            {"name": "products_category_ci_price_asc", "collation": {"locale": "en", "strength": 2}},
+        ),
+        (
+            [("brand", ASCENDING), ("price", ASCENDING)],
+            {"name": "products_brand_ci_price_asc", "collation": {"locale": "en", "strength": 2}},
+        ),
         ([("status", ASCENDING), ("updatedAt", DESCENDING)], {"name": "products_status_updated_desc"}),
     ],
     "categories": [
@@ -72,6 +83,23 @@ MONGO_INDEX_SPECS: dict[str, list[IndexSpec]] = {
         ([("notificationId", ASCENDING)], {"name": "notifications_notification_id_unique", "unique": True}),
         ([("userId", ASCENDING), ("createdAt", DESCENDING)], {"name": "notifications_user_created_desc"}),
     ],
+    "voice_calls": [
+        ([("id", ASCENDING)], {"name": "voice_calls_id_unique", "unique": True}),
+        ([("providerCallId", ASCENDING)], {"name": "voice_calls_provider_call_id_asc"}),
+        ([("status", ASCENDING), ("createdAt", DESCENDING)], {"name": "voice_calls_status_created_desc"}),
+        ([("recoveryKey", ASCENDING), ("createdAt", DESCENDING)], {"name": "voice_calls_recovery_key_created_desc"}),
+        ([("createdAt", DESCENDING)], {"name": "voice_calls_created_desc"}),
+        ([("userId", ASCENDING), ("createdAt", DESCENDING)], {"name": "voice_calls_user_created_desc"}),
+    ],
+    "voice_jobs": [
+        ([("id", ASCENDING)], {"name": "voice_jobs_id_unique", "unique": True}),
+        ([("recoveryKey", ASCENDING)], {"name": "voice_jobs_recovery_key_asc"}),
+        ([("status", ASCENDING), ("nextRunAt", ASCENDING)], {"name": "voice_jobs_status_next_run_asc"}),
+    ],
+    "voice_alerts": [
+        ([("createdAt", DESCENDING)], {"name": "voice_alerts_created_desc"}),
+        ([("severity", ASCENDING), ("createdAt", DESCENDING)], {"name": "voice_alerts_severity_created_desc"}),
+    ],
     "admin_activity_logs": [
         ([("id", ASCENDING)], {"name": "admin_activity_logs_id_unique", "unique": True}),
         ([("adminId", ASCENDING), ("timestamp", DESCENDING)], {"name": "admin_activity_logs_admin_time_desc"}),
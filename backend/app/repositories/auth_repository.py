@@ -26,14 +26,15 @@ class AuthRepository:
         return deepcopy(user)
 
     def get_user_by_id(self, user_id: str) -> dict[str, Any] | None:
+        # Both sources decode a fresh dict per read, so no defensive copy is needed.
         cached = self._read_user_from_redis_by_id(user_id)
         if cached is not None:
-            return deepcopy(cached)
+            return cached
 
         persisted = self._read_user_from_mongo_by_id(user_id)
         if persisted is not None:
             self._write_user_to_redis(persisted)
-            return deepcopy(persisted)
+            return persisted
         return None
 
     def get_user_by_email(self, email: str) -> dict[str, Any] | None:
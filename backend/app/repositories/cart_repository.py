@@ -35,6 +35,30 @@ class CartRepository:
             return deepcopy(persisted)
         return None
 
+    def get_by_id(self, cart_id: str) -> dict[str, Any] | None:
+        # Check Mongo as source of truth
+        collection = self._mongo_collection()
+        if collection is None:
+            return None
+        payload = collection.find_one({"cartId": cart_id})
+        if not payload:
+            return None
+        payload.pop("_id", None)
+        payload.pop("cartId", None)
+        self._write_to_redis(payload)
+        return payload
+
+    def list_all(self) -> list[dict[str, Any]]:
+        collection = self._mongo_collection()
+        if collection is None:
+            return []
+        carts: list[dict[str, Any]] = []
+        for payload in collection.find({}):
+            payload.pop("_id", None)
+            payload.pop("cartId", None)
+            carts.append(payload)
+        return carts
+
     def clear_for_user(self, user_id: str) -> dict[str, Any] | None:
         cart = self.get_for_user_or_session(user_id=user_id, session_id="")
         if not cart:
@@ -71,6 +95,21 @@ class CartRepository:
             return
         client.set(self._redis_key(cart["id"]), json.dumps(cart), ex=60 * 60)
 
+    def _read_from_redis(self, cart_id: str) -> dict[str, Any] | None:
+        client = self._redis_client()
+        if client is None:
+            return None
+        payload = client.get(self._redis_key(cart_id))
+        if not payload:
+            return None
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        try:
+            decoded = json.loads(payload)
+        except json.JSONDecodeError:
+            return None
+        return decoded if isinstance(decoded, dict) else None
+
     def _write_to_mongo(self, cart: dict[str, Any]) -> None:
         collection = self._mongo_collection()
         if collection is None:
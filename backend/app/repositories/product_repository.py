@@ -5,6 +5,11 @@ from copy import deepcopy
 from typing import Any
 
 from app.infrastructure.persistence_clients import MongoClientManager, RedisClientManager
+
+# Matches the case-insensitive products_*_ci_price_asc indexes.
+_CASE_INSENSITIVE = {"locale": "en", "strength": 2}
+
+
 class ProductRepository:
     def __init__(
         self,
@@ -29,6 +34,34 @@ class ProductRepository:
                 self._write_to_redis(row)
         return products
 
+    def list_filtered(
+        self,
+        *,
+        category: str | None = None,
+        brand: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+    ) -> list[dict[str, Any]]:
+        collection = self._mongo_collection()
+        if collection is None:
+            return []
+        query: dict[str, Any] = {}
+        if category:
+            query["category"] = category
+        if brand:
+            query["brand"] = brand
+        price: dict[str, float] = {}
+        if min_price is not None:
+            price["$gte"] = min_price
+        if max_price is not None:
+            price["$lte"] = max_price
+        if price:
+            query["price"] = price
+        rows = collection.find(query, {"_id": 0, "productId": 0}, collation=_CASE_INSENSITIVE)
+        # Sort client-side so names keep list_all's binary ordering rather
+        # than the collation's case-folded one.
+        return sorted(rows, key=lambda row: str(row.get("name", "")))
+
     def get(self, product_id: str) -> dict[str, Any] | None:
         cached = self._read_from_redis(product_id)
         if cached is not None:
@@ -94,15 +94,14 @@ class SessionRepository:
         if not matching:
             return None
             
-        matching.sort(
+        return max(
+            matching,
             key=lambda session: (
                 str(session.get("lastActivityAt", "")),
                 str(session.get("lastActivity", "")),
                 str(session.get("createdAt", "")),
             ),
-            reverse=True,
         )
-        return matching[0]
 
     def count(self) -> int:
         client = self._redis_client()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
 from app.infrastructure.persistence_clients import MongoClientManager
@@ -14,7 +13,7 @@ class SupportRepository:
 
     def create(self, ticket: dict[str, Any]) -> dict[str, Any]:
         self._write_to_mongo(ticket)
-        return deepcopy(ticket)
+        return ticket
 
     def get(self, ticket_id: str) -> dict[str, Any] | None:
         collection = self._mongo_collection()
@@ -25,11 +24,11 @@ class SupportRepository:
             return None
         row.pop("_id", None)
         row.pop("ticketId", None)
-        return deepcopy(row) if isinstance(row, dict) else None
+        return row
 
     def update(self, ticket: dict[str, Any]) -> dict[str, Any]:
         self._write_to_mongo(ticket)
-        return deepcopy(ticket)
+        return ticket
 
     def list(
         self,
@@ -79,6 +78,6 @@ class SupportRepository:
             return
         collection.update_one(
             {"ticketId": ticket["id"]},
-            {"$set": {"ticketId": ticket["id"], **deepcopy(ticket)}},
+            {"$set": {"ticketId": ticket["id"], **ticket}},
             upsert=True,
         )
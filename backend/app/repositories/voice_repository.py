@@ -1,10 +1,28 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Iterable
 
 from app.infrastructure.persistence_clients import MongoClientManager
 
+
+@dataclass(slots=True)
+class CallRecord:
+    """Slim view of a voice call for scans that only need identity and status."""
+
+    id: str
+    status: str
+    provider_call_id: str | None
+
+    @classmethod
+    def from_document(cls, row: dict[str, Any]) -> CallRecord:
+        return cls(
+            id=row["id"],
+            status=row.get("status") or "",
+            provider_call_id=row.get("providerCallId") or None,
+        )
+
+
 class VoiceRepository:
     def __init__(
         self,
@@ -15,18 +33,13 @@ class VoiceRepository:
 
     def get_settings(self) -> dict[str, Any] | None:
         collection = self._mongo_db()["voice_settings"]
-        row = collection.find_one({"id": "global_settings"})
-        if row:
-            row.pop("_id", None)
-            row.pop("id", None)
-            return row
-        return None
+        return collection.find_one({"id": "global_settings"}, {"_id": 0, "id": 0})
 
     def upsert_settings(self, settings: dict[str, Any]) -> None:
         collection = self._mongo_db()["voice_settings"]
         collection.update_one(
             {"id": "global_settings"},
-            {"$set": deepcopy(settings)},
+            {"$set": settings},
             upsert=True,
         )
 
@@ -34,81 +47,147 @@ class VoiceRepository:
         collection = self._mongo_db()["voice_jobs"]
         collection.update_one(
             {"id": job["id"]},
-            {"$set": deepcopy(job)},
+            {"$set": job},
             upsert=True,
         )
 
+    def update_job(self, job_id: str, fields: dict[str, Any]) -> None:
+        collection = self._mongo_db()["voice_jobs"]
+        collection.update_one({"id": job_id}, {"$set": fields})
+
     def get_job(self, job_id: str) -> dict[str, Any] | None:
         collection = self._mongo_db()["voice_jobs"]
-        row = collection.find_one({"id": job_id})
-        if row:
-            row.pop("_id", None)
-            return row
-        return None
+        return collection.find_one({"id": job_id}, {"_id": 0})
+
+    def insert_jobs(self, jobs: list[dict[str, Any]]) -> None:
+        if not jobs:
+            return
+        collection = self._mongo_db()["voice_jobs"]
+        collection.insert_many([dict(job) for job in jobs], ordered=False)
+
+    def existing_job_recovery_keys(self, recovery_keys: Iterable[str]) -> set[str]:
+        keys = list(recovery_keys)
+        if not keys:
+            return set()
+        collection = self._mongo_db()["voice_jobs"]
+        rows = collection.find({"recoveryKey": {"$in": keys}}, {"_id": 0, "recoveryKey": 1})
+        return {str(row["recoveryKey"]) for row in rows}
 
     def list_jobs(self, *, status: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
         collection = self._mongo_db()["voice_jobs"]
         query = {}
         if status:
             query["status"] = status
-        rows = list(collection.find(query).sort("createdAt", -1).limit(limit))
-        for row in rows:
-            row.pop("_id", None)
-        return rows
+        return list(collection.find(query, {"_id": 0}).sort("createdAt", -1).limit(limit))
+
+    def list_due_jobs(self, *, statuses: Iterable[str], due_at: str, limit: int = 1000) -> list[dict[str, Any]]:
+        collection = self._mongo_db()["voice_jobs"]
+        query = {"status": {"$in": list(statuses)}, "nextRunAt": {"$lte": due_at}}
+        rows = collection.find(query, {"_id": 0})
+        return list(rows.sort("nextRunAt", 1).limit(limit))
+
+    def count_jobs_by_status(self, *, statuses: Iterable[str]) -> dict[str, int]:
+        collection = self._mongo_db()["voice_jobs"]
+        pipeline = [
+            {"$match": {"status": {"$in": list(statuses)}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        return {str(row["_id"]): int(row["count"]) for row in collection.aggregate(pipeline)}
 
     def upsert_call(self, call: dict[str, Any]) -> None:
         collection = self._mongo_db()["voice_calls"]
         collection.update_one(
             {"id": call["id"]},
-            {"$set": deepcopy(call)},
+            {"$set": call},
             upsert=True,
         )
 
+    def append_call_attempt(self, call_id: str, attempt: dict[str, Any], fields: dict[str, Any]) -> None:
+        collection = self._mongo_db()["voice_calls"]
+        collection.update_one(
+            {"id": call_id},
+            {"$push": {"attempts": attempt}, "$set": fields},
+        )
+
     def get_call(self, call_id: str) -> dict[str, Any] | None:
         collection = self._mongo_db()["voice_calls"]
-        row = collection.find_one({"id": call_id})
-        if row:
-            row.pop("_id", None)
-            return row
-        return None
+        return collection.find_one({"id": call_id}, {"_id": 0})
 
     def find_call_by_provider_id(self, provider_call_id: str) -> dict[str, Any] | None:
         collection = self._mongo_db()["voice_calls"]
-        row = collection.find_one({"providerCallId": provider_call_id})
-        if row:
-            row.pop("_id", None)
-            return row
-        return None
+        return collection.find_one({"providerCallId": provider_call_id}, {"_id": 0}, sort=[("createdAt", -1)])
+
+    def find_call_by_recovery_key(self, recovery_key: str) -> dict[str, Any] | None:
+        collection = self._mongo_db()["voice_calls"]
+        return collection.find_one({"recoveryKey": recovery_key}, {"_id": 0}, sort=[("createdAt", -1)])
 
     def list_calls(self, *, status: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
         collection = self._mongo_db()["voice_calls"]
         query = {}
         if status:
             query["status"] = status
-        rows = list(collection.find(query).sort("createdAt", -1).limit(limit))
-        for row in rows:
-            row.pop("_id", None)
-        return rows
+        return list(collection.find(query, {"_id": 0}).sort("createdAt", -1).limit(limit))
+
+    def count_calls(
+        self,
+        *,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        user_id: str | None = None,
+    ) -> int:
+        collection = self._mongo_db()["voice_calls"]
+        query: dict[str, Any] = {}
+        if created_from is not None or created_to is not None:
+            created: dict[str, str] = {}
+            if created_from is not None:
+                created["$gte"] = created_from
+            if created_to is not None:
+                created["$lt"] = created_to
+            query["createdAt"] = created
+        if user_id is not None:
+            query["userId"] = user_id
+        return int(collection.count_documents(query))
+
+    def count_calls_by_status(self, *, created_from: str, created_to: str) -> dict[str, int]:
+        collection = self._mongo_db()["voice_calls"]
+        pipeline = [
+            {"$match": {"createdAt": {"$gte": created_from, "$lt": created_to}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        return {str(row["_id"]): int(row["count"]) for row in collection.aggregate(pipeline)}
+
+    def count_calls_by_user(self, *, created_from: str, created_to: str) -> dict[str, int]:
+        collection = self._mongo_db()["voice_calls"]
+        pipeline = [
+            {"$match": {"createdAt": {"$gte": created_from, "$lt": created_to}}},
+            {"$group": {"_id": "$userId", "count": {"$sum": 1}}},
+        ]
+        return {str(row["_id"]): int(row["count"]) for row in collection.aggregate(pipeline)}
+
+    def list_call_records(self, *, statuses: Iterable[str], limit: int = 1000) -> list[CallRecord]:
+        collection = self._mongo_db()["voice_calls"]
+        projection = {"_id": 0, "id": 1, "status": 1, "providerCallId": 1}
+        rows = collection.find({"status": {"$in": list(statuses)}}, projection)
+        return [CallRecord.from_document(row) for row in rows.sort("createdAt", -1).limit(limit)]
 
     def add_alert(self, alert: dict[str, Any]) -> None:
+        # Alerts are built fresh by append_alert and dropped afterwards, so the
+        # _id that insert_one adds to the dict is never observed.
         collection = self._mongo_db()["voice_alerts"]
-        collection.insert_one(deepcopy(alert))
+        collection.insert_one(alert)
 
     def list_alerts(self, *, severity: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
         collection = self._mongo_db()["voice_alerts"]
         query = {}
         if severity:
             query["severity"] = severity
-        rows = list(collection.find(query).sort("createdAt", -1).limit(limit))
-        for row in rows:
-            row.pop("_id", None)
-        return rows
+        return list(collection.find(query, {"_id": 0}).sort("createdAt", -1).limit(limit))
 
     def upsert_suppression(self, user_id: str, payload: dict[str, Any]) -> None:
         collection = self._mongo_db()["voice_suppressions"]
         collection.update_one(
             {"userId": user_id},
-            {"$set": deepcopy(payload)},
+            {"$set": payload},
             upsert=True,
         )
 
@@ -118,19 +197,16 @@ class VoiceRepository:
 
     def list_suppressions(self) -> list[dict[str, Any]]:
         collection = self._mongo_db()["voice_suppressions"]
-        rows = list(collection.find({}).sort("createdAt", -1))
-        for row in rows:
-            row.pop("_id", None)
-        return rows
+        return list(collection.find({}, {"_id": 0}).sort("createdAt", -1))
 
     def is_suppressed(self, user_id: str) -> bool:
         collection = self._mongo_db()["voice_suppressions"]
-        return collection.find_one({"userId": user_id}) is not None
+        return collection.find_one({"userId": user_id}, {"_id": 1}) is not None
 
-    def get_suppressed_user_ids(self) -> set[str]:
+    def get_suppressed_user_ids(self) -> frozenset[str]:
+        # userId is always written as a str by upsert_suppression.
         collection = self._mongo_db()["voice_suppressions"]
-        rows = list(collection.find({}, {"userId": 1}))
-        return {str(row["userId"]) for row in rows}
+        return frozenset(row["userId"] for row in collection.find({}, {"_id": 0, "userId": 1}))
 
     def _mongo_db(self) -> Any:
         client = self.mongo_manager.client
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import heapq
+
 from app.repositories.interaction_repository import InteractionRepository
 from app.repositories.order_repository import OrderRepository
 from app.repositories.product_repository import ProductRepository
 from app.repositories.session_repository import SessionRepository
 from app.repositories.support_repository import SupportRepository
 from app.services.voice_recovery_service import VoiceRecoveryService
-from app.core.utils import utc_now
+from app.core.utils import day_bounds, utc_now
 
 
 class AdminService:
@@ -27,10 +29,10 @@ class AdminService:
         self.voice_recovery_service = voice_recovery_service
 
     def stats(self) -> dict[str, object]:
-        today = utc_now().date().isoformat()
+        today, tomorrow = day_bounds(utc_now())
         active_sessions = self.session_repository.count()
         orders = self.order_repository.list_all()
-        orders_today_rows = [order for order in orders if str(order.get("createdAt", "")).startswith(today)]
+        orders_today_rows = [order for order in orders if today <= (order.get("createdAt") or "") < tomorrow]
         orders_today = len(orders_today_rows)
         revenue_today = round(sum(float(order["total"]) for order in orders_today_rows), 2)
         product_names = self.product_repository.name_map()
@@ -46,7 +48,7 @@ class AdminService:
                 )
                 row["sold"] = int(row["sold"]) + int(item["quantity"])
 
-        top_products = sorted(by_product.values(), key=lambda item: int(item["sold"]), reverse=True)[:5]
+        top_products = heapq.nlargest(5, by_product.values(), key=lambda item: int(item["sold"]))
 
         interactions = self.interaction_repository.list_by_date(date_prefix=today)
         by_agent: dict[str, dict[str, object]] = {}
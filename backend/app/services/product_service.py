@@ -38,7 +38,12 @@ class ProductService:
         safe_page = max(1, page)
         safe_limit = min(100, max(1, limit))
 
-        products = self.product_repository.list_all()
+        products = self.product_repository.list_filtered(
+            category=normalized_category or None,
+            brand=normalized_brand or None,
+            min_price=min_price,
+            max_price=max_price,
+        )
 
         # Phase 1: Hard Filtering (Category, Brand, Price, Status)
         def hard_filter(item: dict[str, Any]) -> bool:
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
 from app.repositories.support_repository import SupportRepository
 from app.core.utils import generate_id, iso_now
 
+_TICKET_TEMPLATE: dict[str, Any] = {
+    "id": None,
+    "userId": None,
+    "sessionId": None,
+    "issue": "",
+    "category": "general",
+    "priority": "normal",
+    "status": "open",
+    "channel": "web",
+    "messages": None,
+    "resolution": None,
+    "createdAt": None,
+    "updatedAt": None,
+}
+
 
 class SupportService:
     def __init__(
@@ -28,33 +42,26 @@ class SupportService:
         if normalized_priority not in {"low", "normal", "high", "urgent"}:
             normalized_priority = "normal"
         normalized_category = str(category).strip().lower() or "general"
-        ticket = {
-            "id": generate_id("ticket"),
-            "userId": user_id,
-            "sessionId": session_id,
-            "issue": issue.strip(),
-            "category": normalized_category,
-            "priority": normalized_priority,
-            "status": "open",
-            "channel": channel,
-            "messages": [
-                {
-                    "actor": "customer",
-                    "message": issue.strip(),
-                    "timestamp": iso_now(),
-                }
-            ],
-            "resolution": None,
-            "createdAt": iso_now(),
-            "updatedAt": iso_now(),
-        }
+        now = iso_now()
+        message = issue.strip()
+        ticket = _TICKET_TEMPLATE.copy()
+        ticket["id"] = generate_id("ticket")
+        ticket["userId"] = user_id
+        ticket["sessionId"] = session_id
+        ticket["issue"] = message
+        ticket["category"] = normalized_category
+        ticket["priority"] = normalized_priority
+        ticket["channel"] = channel
+        ticket["messages"] = [{"actor": "customer", "message": message, "timestamp": now}]
+        ticket["createdAt"] = now
+        ticket["updatedAt"] = now
         return self.support_repository.create(ticket)
 
     def get_ticket(self, *, ticket_id: str) -> dict[str, Any]:
         row = self.support_repository.get(ticket_id)
         if row is None:
             raise ValueError("ticket_not_found")
-        return deepcopy(row)
+        return row
 
     def list_tickets(
         self,
@@ -84,17 +91,22 @@ class SupportService:
         if ticket is None:
             raise ValueError("ticket_not_found")
 
+        changed = False
         if status is not None:
             normalized_status = str(status).strip().lower()
             if normalized_status not in {"open", "in_progress", "resolved", "closed"}:
                 raise ValueError("invalid_ticket_status")
-            ticket["status"] = normalized_status
+            if ticket.get("status") != normalized_status:
+                ticket["status"] = normalized_status
+                changed = True
 
         if priority is not None:
             normalized_priority = str(priority).strip().lower()
             if normalized_priority not in {"low", "normal", "high", "urgent"}:
                 raise ValueError("invalid_ticket_priority")
-            ticket["priority"] = normalized_priority
+            if ticket.get("priority") != normalized_priority:
+                ticket["priority"] = normalized_priority
+                changed = True
 
         if note:
             messages = ticket.setdefault("messages", [])
@@ -103,13 +115,17 @@ class SupportService:
                     {
                         "actor": actor,
                         "message": str(note).strip(),
-                        "timestamp": self.store.iso_now(),
+                        "timestamp": iso_now(),
                     }
                 )
+                changed = True
+
+        if not changed:
+            return ticket
 
         if ticket.get("status") in {"resolved", "closed"}:
             ticket["resolution"] = (note or ticket.get("resolution") or "").strip() or "Resolved by support"
-        ticket["updatedAt"] = self.store.iso_now()
+        ticket["updatedAt"] = iso_now()
         return self.support_repository.update(ticket)
 
     def ensure_open_ticket(
@@ -126,7 +142,7 @@ class SupportService:
             user_id=user_id,
             session_id=session_id if user_id is None else None,
             status="open",
-            limit=10,
+            limit=1,
         )
         if existing:
             top = existing[0]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from datetime import datetime
 from typing import Any
-from app.core.utils import generate_id, iso_now
+from app.core.utils import day_bounds, generate_id, iso_now
+from app.services.voice.helpers import PENDING_JOB_STATUSES
 from app.repositories.voice_repository import VoiceRepository
+from app.services.voice.settings import VoiceSettings
 
 def append_alert(
     *,
@@ -25,14 +27,14 @@ def append_alert(
 def evaluate_alerts(
     *,
     now: datetime,
-    settings: dict[str, Any],
+    settings: VoiceSettings,
     voice_service: Any,
 ) -> int:
     generated = 0
-    backlog_threshold = int(settings.get("alertBacklogThreshold", 50))
-    failure_ratio_threshold = float(settings.get("alertFailureRatioThreshold", 0.35))
-    pending = len(voice_service.list_jobs(limit=1000, status="queued")) + len(
-        voice_service.list_jobs(limit=1000, status="retrying")
+    backlog_threshold = settings.alert_backlog_threshold
+    failure_ratio_threshold = settings.alert_failure_ratio_threshold
+    pending = sum(
+        voice_service.voice_repository.count_jobs_by_status(statuses=PENDING_JOB_STATUSES).values()
     )
     if pending > backlog_threshold:
         append_alert(
@@ -44,23 +46,21 @@ def evaluate_alerts(
         )
         generated += 1
 
-    today = now.date().isoformat()
-    calls_today = [row for row in voice_service.list_calls(limit=2000) if str(row.get("createdAt", "")).startswith(today)]
-    terminal = [
-        row
-        for row in calls_today
-        if str(row.get("status", "")) in {"completed", "failed", "suppressed", "skipped"}
-    ]
-    failed = [row for row in terminal if str(row.get("status", "")) == "failed"]
+    created_from, created_to = day_bounds(now)
+    counts_today = voice_service.voice_repository.count_calls_by_status(
+        created_from=created_from, created_to=created_to
+    )
+    terminal = sum(counts_today.get(status, 0) for status in ("completed", "failed", "suppressed", "skipped"))
+    failed = counts_today.get("failed", 0)
     if terminal:
-        ratio = len(failed) / len(terminal)
+        ratio = failed / terminal
         if ratio > failure_ratio_threshold:
             ratio_val = float(ratio) # Ensure float
             append_alert(
                 code="VOICE_FAILURE_RATIO_HIGH",
                 message=f"Voice failure ratio today is {ratio_val:.2f}, above threshold.",
                 severity="critical",
-                details={"terminalCalls": len(terminal), "failedCalls": len(failed), "ratio": ratio_val},
+                details={"terminalCalls": terminal, "failedCalls": failed, "ratio": ratio_val},
                 voice_repository=voice_service.voice_repository,
             )
             generated += 1
@@ -69,35 +69,27 @@ def evaluate_alerts(
 def get_stats(
     *,
     now: datetime,
-    settings: dict[str, Any],
+    settings: VoiceSettings,
     voice_service: Any,
 ) -> dict[str, Any]:
-    today = now.date().isoformat()
-    calls = voice_service.voice_repository.list_calls(limit=5000)
-    jobs = voice_service.voice_repository.list_jobs(limit=5000)
-    calls_today = [row for row in calls if str(row.get("createdAt", "")).startswith(today)]
-    completed_today = [row for row in calls_today if str(row.get("status", "")) == "completed"]
-    failed_today = [row for row in calls_today if str(row.get("status", "")) == "failed"]
-    suppressed_today = [
-        row for row in calls_today if str(row.get("status", "")) in {"suppressed", "skipped"}
-    ]
-    pending_jobs = [row for row in jobs if str(row.get("status", "")) in {"queued", "retrying"}]
-    retrying_jobs = [row for row in jobs if str(row.get("status", "")) == "retrying"]
-    estimated_spend = round(
-        len(calls_today) * float(settings.get("estimatedCostPerCallUsd", 0.0)),
-        2,
+    created_from, created_to = day_bounds(now)
+    counts_today = voice_service.voice_repository.count_calls_by_status(
+        created_from=created_from, created_to=created_to
     )
+    calls_today = sum(counts_today.values())
+    job_counts = voice_service.voice_repository.count_jobs_by_status(statuses=PENDING_JOB_STATUSES)
+    estimated_spend = round(calls_today * settings.estimated_cost_per_call_usd, 2)
     return {
-        "enabled": bool(settings.get("enabled", False)),
-        "totalCalls": len(calls),
-        "callsToday": len(calls_today),
-        "completedToday": len(completed_today),
-        "failedToday": len(failed_today),
-        "suppressedToday": len(suppressed_today),
-        "pendingJobs": len(pending_jobs),
-        "retryingJobs": len(retrying_jobs),
+        "enabled": settings.enabled,
+        "totalCalls": voice_service.voice_repository.count_calls(),
+        "callsToday": calls_today,
+        "completedToday": counts_today.get("completed", 0),
+        "failedToday": counts_today.get("failed", 0),
+        "suppressedToday": counts_today.get("suppressed", 0) + counts_today.get("skipped", 0),
+        "pendingJobs": sum(job_counts.values()),
+        "retryingJobs": job_counts.get("retrying", 0),
         "estimatedSpendToday": estimated_spend,
-        "dailyBudgetUsd": float(settings.get("dailyBudgetUsd", 0.0)),
-        "maxCallsPerDay": int(settings.get("maxCallsPerDay", 0)),
+        "dailyBudgetUsd": settings.daily_budget_usd,
+        "maxCallsPerDay": settings.max_calls_per_day,
         "alertsOpen": len(voice_service.list_alerts(limit=200)),
     }
@@ -1,9 +1,10 @@
 from __future__ import annotations
-from copy import deepcopy
 from typing import Any
 from app.core.utils import generate_id, iso_now
 from app.repositories.voice_repository import VoiceRepository
+from app.services.voice.guardrails import DailyCallCounts
 from app.services.voice.outcome import apply_outcome_actions
+from app.services.voice.settings import VoiceSettings
 
 def list_calls(voice_repository: VoiceRepository, *, limit: int = 100, status: str | None = None) -> list[dict[str, Any]]:
     return voice_repository.list_calls(limit=limit, status=status)
@@ -15,49 +16,62 @@ def record_call_event(
     user: dict[str, Any] | None,
     status: str,
     error: str | None,
+    settings: VoiceSettings,
     voice_repository: VoiceRepository,
-    voice_service: Any,
     request_payload: dict[str, Any] | None = None,
     response_payload: dict[str, Any] | None = None,
     provider_call_id: str | None = None,
     attempt_number: int | None = None,
     next_retry_at: str | None = None,
+    daily_counts: DailyCallCounts | None = None,
 ) -> None:
-    call = get_or_create_call(job=job, cart=cart, user=user, voice_repository=voice_repository, voice_service=voice_service)
+    now_iso = iso_now()
+    call = get_or_create_call(
+        job=job,
+        cart=cart,
+        user=user,
+        settings=settings,
+        voice_repository=voice_repository,
+        now_iso=now_iso,
+        daily_counts=daily_counts,
+    )
     attempt_index = attempt_number if attempt_number is not None else int(job.get("attempt", 0))
     event = {
         "attempt": max(1, attempt_index),
-        "timestamp": iso_now(),
+        "timestamp": now_iso,
         "status": status,
         "error": error,
         "request": request_payload or {},
         "response": response_payload or {},
     }
-    call.setdefault("attempts", []).append(event)
-    call["attemptCount"] = len(call["attempts"])
-    call["status"] = status
-    call["updatedAt"] = iso_now()
-    call["lastError"] = error
-    call["nextRetryAt"] = next_retry_at
+    attempts = call.get("attempts") or []
+    fields: dict[str, Any] = {
+        "attemptCount": len(attempts) + 1,
+        "status": status,
+        "updatedAt": now_iso,
+        "lastError": error,
+        "nextRetryAt": next_retry_at,
+    }
     if provider_call_id:
-        call["providerCallId"] = provider_call_id
-    voice_repository.upsert_call(call)
+        fields["providerCallId"] = provider_call_id
+    # Push only the new attempt rather than rewriting the whole history.
+    voice_repository.append_call_attempt(call["id"], event, fields)
 
 def get_or_create_call(
     *,
     job: dict[str, Any],
     cart: dict[str, Any] | None,
     user: dict[str, Any] | None,
+    settings: VoiceSettings,
     voice_repository: VoiceRepository,
-    voice_service: Any,
+    now_iso: str,
+    daily_counts: DailyCallCounts | None = None,
 ) -> dict[str, Any]:
     recovery_key = str(job.get("recoveryKey", "")).strip()
-    calls = voice_repository.list_calls(limit=1000) # Assuming a reasonable limit for checking existing calls
-    for existing in calls:
-        if str(existing.get("recoveryKey", "")) == recovery_key:
-            return deepcopy(existing)
+    existing = voice_repository.find_call_by_recovery_key(recovery_key)
+    if existing is not None:
+        return existing
 
-    settings = voice_service.get_settings()
     cart_total = float((cart or {}).get("total", 0.0))
     item_count = int((cart or {}).get("itemCount", 0))
     payload = {
@@ -73,31 +87,41 @@ def get_or_create_call(
         "providerCallId": None,
         "providerEventKeys": [],
         "providerEvents": [],
-        "scriptVersion": str(settings.get("scriptVersion", "v1")),
+        "scriptVersion": settings.script_version,
         "campaign": {
             "itemCount": item_count,
             "cartTotal": cart_total,
-            "template": str(settings.get("scriptTemplate", "")),
+            "template": settings.script_template,
         },
         "outcome": "",
         "followupApplied": False,
-        "estimatedCostUsd": float(settings.get("estimatedCostPerCallUsd", 0.0)),
-        "createdAt": iso_now(),
-        "updatedAt": iso_now(),
+        "estimatedCostUsd": settings.estimated_cost_per_call_usd,
+        "createdAt": now_iso,
+        "updatedAt": now_iso,
         "nextRetryAt": None,
         "lastError": None,
     }
     voice_repository.upsert_call(payload)
+    if daily_counts is not None:
+        daily_counts.record(payload["userId"])
     return payload
 
-def update_call_progress(voice_repository: VoiceRepository, call_id: str, status: str, payload: dict[str, Any]) -> None:
-    call = voice_repository.get_call(call_id)
+def update_call_progress(
+    voice_repository: VoiceRepository,
+    call_id: str,
+    status: str,
+    payload: dict[str, Any],
+    call: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    if call is None:
+        call = voice_repository.get_call(call_id)
     if not call:
-        return
+        return None
     call["status"] = status
     call["updatedAt"] = iso_now()
     call["providerPayload"] = payload
     voice_repository.upsert_call(call)
+    return call
 
 def update_call_terminal(
     voice_repository: VoiceRepository,
@@ -106,14 +130,17 @@ def update_call_terminal(
     outcome: str,
     payload: dict[str, Any],
     voice_service: Any,
-) -> None:
-    call = voice_repository.get_call(call_id)
+    call: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    if call is None:
+        call = voice_repository.get_call(call_id)
     if not call:
-        return
+        return None
     call["status"] = status
     call["outcome"] = outcome
     call["providerPayload"] = payload
-    call["updatedAt"] = iso_now()
+    now_iso = iso_now()
+    call["updatedAt"] = now_iso
     voice_repository.upsert_call(call)
     if not bool(call.get("followupApplied", False)):
         apply_outcome_actions(
@@ -124,5 +151,6 @@ def update_call_terminal(
         )
         # After applying actions, update the call to mark followup as applied
         call["followupApplied"] = True
-        call["updatedAt"] = iso_now()
+        call["updatedAt"] = now_iso
         voice_repository.upsert_call(call)
+    return call
@@ -1,20 +1,40 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any
+from app.services.voice.settings import VoiceSettings
+
+_TEMPLATE_ERRORS = (KeyError, ValueError, TypeError, IndexError, AttributeError)
+
+@lru_cache(maxsize=32)
+def _template_renders(template: str) -> bool:
+    # Trial-render with values shaped like a real call (name is never empty)
+    # and cache the verdict per template string.
+    try:
+        template.format(name="there", item_count=1, cart_total=1.0)
+    except _TEMPLATE_ERRORS:
+        return False
+    return True
 
 def build_campaign_payload(
     *,
     user: dict[str, Any],
     cart: dict[str, Any],
-    settings: dict[str, Any],
+    settings: VoiceSettings,
     default_template: str,
 ) -> dict[str, Any]:
     name = str(user.get("name", "")).strip() or "there"
     item_count = int(cart.get("itemCount", 0))
     cart_total = float(cart.get("total", 0.0))
-    template = str(settings.get("scriptTemplate", "")).strip() or default_template
-    try:
-        script = template.format(name=name, item_count=item_count, cart_total=cart_total)
-    except (KeyError, ValueError, TypeError):
+    template = settings.script_template.strip() or default_template
+    script = None
+    if _template_renders(template):
+        # Still guarded: a template can depend on the actual values, e.g.
+        # {name[5]} passes the trial render but not for a short name.
+        try:
+            script = template.format(name=name, item_count=item_count, cart_total=cart_total)
+        except _TEMPLATE_ERRORS:
+            script = None
+    if script is None:
         script = (
             f"Hi {name}, you still have {item_count} item(s) in your cart worth "
             f"${cart_total:.2f}. Would you like help checking out?"
@@ -35,13 +55,13 @@ def build_campaign_payload(
         )
     
     return {
-        "scriptVersion": str(settings.get("scriptVersion", "v1")),
+        "scriptVersion": settings.script_version,
         "scriptText": script,
         "cart": {
             "id": str(cart.get("id", "")),
             "itemCount": item_count,
             "total": round(cart_total, 2),
-            "currency": str(cart.get("currency", "USD")),
+            "currency": cart.get("currency") or "USD",
             "items": items,
         },
         "customer": {
@@ -49,6 +69,6 @@ def build_campaign_payload(
             "name": name,
             "email": str(user.get("email", "")),
             "timezone": str(user.get("timezone", "")).strip()
-            or str(settings.get("defaultTimezone", "UTC")),
+            or settings.default_timezone,
         },
     }
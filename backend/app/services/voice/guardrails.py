@@ -1,23 +1,39 @@
 from __future__ import annotations
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, tzinfo
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
+from app.core.utils import day_bounds
+from app.repositories.voice_repository import VoiceRepository
+from app.services.voice.settings import VoiceSettings
+
+@lru_cache(maxsize=512)
+def _zone_for(tz_name: str) -> tzinfo:
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return timezone.utc
+
+_UTC_NAMES = frozenset(("", "UTC", "Etc/UTC"))
+
+def _local_now(now: datetime, tz_name: str) -> datetime:
+    # The scheduler clock is already UTC, so the default timezone needs no
+    # astimezone conversion at all.
+    if tz_name in _UTC_NAMES and now.tzinfo is timezone.utc:
+        return now
+    return now.astimezone(_zone_for(tz_name))
 
 def in_quiet_hours(
     *,
     user: dict[str, Any],
     now: datetime,
-    settings: dict[str, Any],
+    settings: VoiceSettings,
 ) -> bool:
-    tz_name = str(user.get("timezone", "")).strip() or str(settings.get("defaultTimezone", "UTC")).strip()
-    try:
-        zone = ZoneInfo(tz_name)
-    except Exception:
-        zone = timezone.utc
-    local_now = now.astimezone(zone)
+    tz_name = str(user.get("timezone", "")).strip() or settings.default_timezone
+    local_now = _local_now(now, tz_name)
     hour = local_now.hour
-    start = int(settings.get("quietHoursStart", 21))
-    end = int(settings.get("quietHoursEnd", 8))
+    start = settings.quiet_hours_start
+    end = settings.quiet_hours_end
     if start == end:
         return False
     if start < end:
@@ -28,16 +44,12 @@ def next_non_quiet_time(
     *,
     user: dict[str, Any],
     now: datetime,
-    settings: dict[str, Any],
+    settings: VoiceSettings,
 ) -> datetime:
-    tz_name = str(user.get("timezone", "")).strip() or str(settings.get("defaultTimezone", "UTC")).strip()
-    try:
-        zone = ZoneInfo(tz_name)
-    except Exception:
-        zone = timezone.utc
-    local_now = now.astimezone(zone)
-    start = int(settings.get("quietHoursStart", 21))
-    end = int(settings.get("quietHoursEnd", 8))
+    tz_name = str(user.get("timezone", "")).strip() or settings.default_timezone
+    local_now = _local_now(now, tz_name)
+    start = settings.quiet_hours_start
+    end = settings.quiet_hours_end
     if start == end:
         return now + timedelta(minutes=1)
 
@@ -55,27 +67,42 @@ def next_non_quiet_time(
         local_target = local_target + timedelta(minutes=1)
     return local_target.astimezone(timezone.utc)
 
+class DailyCallCounts:
+    """Today's voice call counts for one scheduler tick.
+
+    Loaded with a single aggregation when the tick starts and bumped in memory
+    as calls are created, so each guardrail check is a dict lookup instead of
+    a count query against ``voice_calls``.
+    """
+
+    def __init__(self, *, voice_repository: VoiceRepository, now: datetime) -> None:
+        created_from, created_to = day_bounds(now)
+        self.by_user = voice_repository.count_calls_by_user(
+            created_from=created_from, created_to=created_to
+        )
+        self.total = sum(self.by_user.values())
+
+    def for_user(self, user_id: str) -> int:
+        return self.by_user.get(user_id, 0)
+
+    def record(self, user_id: str) -> None:
+        self.total += 1
+        self.by_user[user_id] = self.by_user.get(user_id, 0) + 1
+
 def budget_and_cap_guardrails(
     *,
     user_id: str,
-    settings: dict[str, Any],
-    now: datetime,
-    voice_service: Any,
+    settings: VoiceSettings,
+    daily_counts: DailyCallCounts,
 ) -> str:
-    today = now.date().isoformat()
-    calls = voice_service.voice_repository.list_calls(limit=5000)
-
-    calls_today = [row for row in calls if str(row.get("createdAt", "")).startswith(today)]
-    if len(calls_today) >= int(settings.get("maxCallsPerDay", 0)):
+    calls_today = daily_counts.total
+    if calls_today >= settings.max_calls_per_day:
         return "max_calls_per_day_reached"
 
-    user_calls_today = [row for row in calls_today if str(row.get("userId", "")) == user_id]
-    if len(user_calls_today) >= int(settings.get("maxCallsPerUserPerDay", 0)):
+    if daily_counts.for_user(user_id) >= settings.max_calls_per_user_per_day:
         return "max_calls_per_user_per_day_reached"
 
-    spend_today = len(calls_today) * float(settings.get("estimatedCostPerCallUsd", 0.0))
-    if spend_today + float(settings.get("estimatedCostPerCallUsd", 0.0)) > float(
-        settings.get("dailyBudgetUsd", 0.0)
-    ):
+    cost_per_call = settings.estimated_cost_per_call_usd
+    if calls_today * cost_per_call + cost_per_call > settings.daily_budget_usd:
         return "daily_budget_exceeded"
     return "ok"
@@ -1,16 +1,53 @@
 from __future__ import annotations
 import hashlib
 import json
+import sys
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
+ACTIVE_CALL_STATUSES = frozenset(("initiated", "ringing", "in_progress"))
+PENDING_JOB_STATUSES = frozenset(("queued", "retrying"))
+
+_STATUS_TOKEN_TABLE = str.maketrans({"-": "_", " ": "_"})
+
+_PROVIDER_STATUS_MAP = {
+    "queued": "ringing",
+    "dialing": "ringing",
+    "ringing": "ringing",
+    "connected": "in_progress",
+    "answered": "in_progress",
+    "in_progress": "in_progress",
+    "active": "in_progress",
+    "completed": "completed",
+    "success": "completed",
+    "ended": "completed",
+    "done": "completed",
+    "failed": "failed",
+    "error": "failed",
+    "busy": "failed",
+    "cancelled": "failed",
+    "canceled": "failed",
+    "no_answer": "failed",
+    "voicemail": "failed",
+    "dropped": "failed",
+    "timeout": "failed",
+}
+
 def parse_iso(value: Any) -> datetime | None:
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str):
         return None
+    return _parse_iso_string(value)
+
+@lru_cache(maxsize=4096)
+def _parse_iso_string(value: str) -> datetime | None:
+    # Cart updatedAt and order createdAt values repeat across scheduler ticks;
+    # datetimes are immutable, so cached results are safe to share.
     raw = value.strip()
-    if raw.endswith("Z"):
-        raw = raw[:-1] + "+00:00"
+    if not raw:
+        return None
+    # fromisoformat accepts a trailing "Z" natively on Python 3.11+.
     try:
         parsed = datetime.fromisoformat(raw)
     except ValueError:
@@ -40,33 +77,34 @@ def normalize_backoff_list(raw: Any) -> list[int]:
         return [60, 300, 900]
     return values
 
+_PROVIDER_CALL_ID_KEYS = ("call_id", "callId", "id", "uuid")
+_PROVIDER_EVENT_ID_KEYS = ("event_id", "eventId", "webhook_id", "webhookId", "message_id", "messageId")
+
+def _first_text(containers: list[dict[str, Any]], keys: tuple[str, ...]) -> str | None:
+    for container in containers:
+        for key in keys:
+            value = container.get(key)
+            if isinstance(value, str):
+                value = value.strip()
+                if value:
+                    return value
+    return None
+
 def extract_provider_call_id(payload: dict[str, Any]) -> str | None:
-    direct_keys = ("call_id", "callId", "id", "uuid")
     containers: list[dict[str, Any]] = [payload]
     for key in ("data", "call", "payload"):
         nested = payload.get(key)
         if isinstance(nested, dict):
             containers.append(nested)
-    for container in containers:
-        for key in direct_keys:
-            value = container.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-    return None
+    call_id = _first_text(containers, _PROVIDER_CALL_ID_KEYS)
+    return sys.intern(call_id) if call_id else None
 
 def extract_provider_event_id(payload: dict[str, Any]) -> str | None:
-    keys = ("event_id", "eventId", "webhook_id", "webhookId", "message_id", "messageId")
-    for key in keys:
-        value = payload.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+    containers: list[dict[str, Any]] = [payload]
     data = payload.get("data")
     if isinstance(data, dict):
-        for key in keys:
-            value = data.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-    return None
+        containers.append(data)
+    return _first_text(containers, _PROVIDER_EVENT_ID_KEYS)
 
 def provider_event_key(payload: dict[str, Any], superu_client: Any) -> str:
     event_id = extract_provider_event_id(payload)
@@ -95,30 +133,12 @@ def normalize_provider_status(payload: dict[str, Any]) -> str:
         or payload.get("event")
         or ""
     )
-    value = str(raw).strip().lower().replace("-", "_").replace(" ", "_")
-    if value in {"queued", "dialing", "ringing"}:
-        return "ringing"
-    if value in {"connected", "answered", "in_progress", "active"}:
-        return "in_progress"
-    if value in {"completed", "success", "ended", "done"}:
-        return "completed"
-    if value in {
-        "failed",
-        "error",
-        "busy",
-        "cancelled",
-        "canceled",
-        "no_answer",
-        "voicemail",
-        "dropped",
-        "timeout",
-    }:
-        return "failed"
-    return "in_progress"
+    value = str(raw).strip().lower().translate(_STATUS_TOKEN_TABLE)
+    return _PROVIDER_STATUS_MAP.get(value, "in_progress")
 
 def extract_outcome(payload: dict[str, Any]) -> str:
     for key in ("outcome", "disposition", "result", "intent"):
         value = payload.get(key)
         if isinstance(value, str) and value.strip():
-            return value.strip().lower().replace("-", "_").replace(" ", "_")
+            return value.strip().lower().translate(_STATUS_TOKEN_TABLE)
     return normalize_provider_status(payload)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any
-from copy import deepcopy
-from app.services.voice.helpers import parse_iso, normalize_backoff_list, extract_provider_call_id
-from app.services.voice.guardrails import in_quiet_hours, next_non_quiet_time, budget_and_cap_guardrails
+from app.services.voice.helpers import PENDING_JOB_STATUSES, parse_iso, extract_provider_call_id
+from app.services.voice.guardrails import DailyCallCounts, in_quiet_hours, next_non_quiet_time, budget_and_cap_guardrails
 from app.services.voice.campaign import build_campaign_payload
 from app.services.voice.alerts import append_alert
+from app.services.voice.settings import VoiceSettings
 
 from app.core.utils import generate_id, iso_now
 from app.repositories.voice_repository import VoiceRepository
@@ -16,31 +16,19 @@ def enqueue_abandoned_cart_jobs(
     now: datetime,
     voice_repository: VoiceRepository,
     cart_repository: CartRepository,
-    settings: dict[str, Any],
+    settings: VoiceSettings,
     voice_service: Any,
 ) -> int:
-    if not bool(settings.get("enabled", False)):
+    if not settings.enabled:
         return 0
-    cutoff = now - timedelta(minutes=int(settings.get("abandonmentMinutes", 30)))
-    enqueued = 0
-    
-    carts = cart_repository.list_all()
-    # existing_jobs = voice_repository.list_jobs(limit=5000)
-    # Actually, we might want to check recoveryKey efficiently. 
-    # For now, let's keep it simple and list all active jobs.
-    active_jobs = voice_repository.list_jobs(limit=2000)
-    existing_keys = {
-        str(job.get("recoveryKey", ""))
-        for job in active_jobs
-        if str(job.get("status", ""))
-        in {"queued", "retrying", "processing", "completed", "cancelled", "dead_letter"}
-    }
+    cutoff = now - timedelta(minutes=settings.abandonment_minutes)
 
-    for cart in carts:
-        user_id = str(cart.get("userId", "")).strip()
+    candidates: dict[str, dict[str, Any]] = {}
+    for cart in cart_repository.list_all():
+        user_id = cart.get("userId")
         if not user_id:
             continue
-        if int(cart.get("itemCount", 0)) <= 0:
+        if (cart.get("itemCount") or 0) <= 0:
             continue
         updated_at = parse_iso(cart.get("updatedAt"))
         if updated_at is None or updated_at > cutoff:
@@ -48,49 +36,61 @@ def enqueue_abandoned_cart_jobs(
         if voice_service._has_newer_order(user_id=user_id, since=updated_at):
             continue
         recovery_key = f"{cart['id']}::{cart['updatedAt']}"
-        
-        # Idempotency check
-        # We can use a dedicated collection or just check voice_calls
-        if recovery_key in existing_keys:
-            continue
-            
-        job = {
+        candidates[recovery_key] = {"userId": user_id, "cart": cart}
+
+    if not candidates:
+        return 0
+    existing_keys = voice_repository.existing_job_recovery_keys(candidates.keys())
+    created_at = iso_now()
+    jobs = [
+        {
             "id": generate_id("vjob"),
             "status": "queued",
-            "userId": user_id,
-            "sessionId": str(cart.get("sessionId", "")),
-            "cartId": str(cart["id"]),
+            "userId": candidate["userId"],
+            "sessionId": candidate["cart"].get("sessionId") or "",
+            "cartId": candidate["cart"]["id"],
             "recoveryKey": recovery_key,
             "attempt": 0,
             "nextRunAt": now.isoformat(),
             "lastError": None,
-            "createdAt": iso_now(),
-            "updatedAt": iso_now(),
+            "createdAt": created_at,
+            "updatedAt": created_at,
         }
-        voice_repository.upsert_job(job)
-        enqueued += 1
-        existing_keys.add(recovery_key)
-    return enqueued
+        for recovery_key, candidate in candidates.items()
+        if recovery_key not in existing_keys
+    ]
+    voice_repository.insert_jobs(jobs)
+    return len(jobs)
 
 def process_due_jobs(
     *,
     now: datetime,
     voice_repository: VoiceRepository,
     voice_service: Any,
+    settings: VoiceSettings,
+    suppressed: frozenset[str],
 ) -> dict[str, int]:
-    # We need to fetch jobs that are due
-    all_jobs = voice_repository.list_jobs(limit=1000)
-    due_jobs = [
-        job for job in all_jobs
-        if str(job.get("status", "")) in {"queued", "retrying"}
-        and parse_iso(job.get("nextRunAt")) is not None
-        and parse_iso(job.get("nextRunAt")) <= now
-    ]
-    due_jobs.sort(key=lambda row: str(row.get("nextRunAt", "")))
-    
+    # nextRunAt is always written as a UTC isoformat() string, so the
+    # lexicographic comparison in the query orders the same as the datetimes.
+    due_jobs = voice_repository.list_due_jobs(
+        statuses=PENDING_JOB_STATUSES,
+        due_at=now.isoformat(),
+        limit=1000,
+    )
+
     counters = {"completed": 0, "retried": 0, "deadLetter": 0, "cancelled": 0}
+    if not due_jobs:
+        return counters
+    daily_counts = DailyCallCounts(voice_repository=voice_repository, now=now)
     for job in due_jobs:
-        result = process_single_job(job=job, now=now, voice_service=voice_service)
+        result = process_single_job(
+            job=job,
+            now=now,
+            voice_service=voice_service,
+            settings=settings,
+            suppressed=suppressed,
+            daily_counts=daily_counts,
+        )
         counters[result] = counters.get(result, 0) + 1
     return counters
 
@@ -99,9 +99,11 @@ def process_single_job(
     job: dict[str, Any],
     now: datetime,
     voice_service: Any,
+    settings: VoiceSettings,
+    suppressed: frozenset[str],
+    daily_counts: DailyCallCounts,
 ) -> str:
-    settings = voice_service.get_settings()
-    if bool(settings.get("killSwitch", False)):
+    if settings.kill_switch:
         complete_job(job_id=str(job["id"]), status="cancelled", error="kill_switch", voice_repository=voice_service.voice_repository)
         append_alert(
             code="VOICE_KILL_SWITCH_ACTIVE",
@@ -119,21 +121,23 @@ def process_single_job(
             job=job,
             cart=cart,
             user=user,
+            settings=settings,
+            daily_counts=daily_counts,
             status="skipped",
             error="cart_or_user_missing",
         )
         return "cancelled"
 
     user_id = str(user.get("id", "")).strip()
-    if user_id in voice_service._suppressed_users():
+    if user_id in suppressed:
         complete_job(job_id=str(job["id"]), status="cancelled", error="suppressed_user", voice_repository=voice_service.voice_repository)
-        voice_service._record_call_event(job=job, cart=cart, user=user, status="suppressed", error="suppressed_user")
+        voice_service._record_call_event(job=job, cart=cart, user=user, settings=settings, daily_counts=daily_counts, status="suppressed", error="suppressed_user")
         return "cancelled"
 
     phone = str(user.get("phone", "")).strip()
     if not phone:
         complete_job(job_id=str(job["id"]), status="cancelled", error="missing_phone", voice_repository=voice_service.voice_repository)
-        voice_service._record_call_event(job=job, cart=cart, user=user, status="skipped", error="missing_phone")
+        voice_service._record_call_event(job=job, cart=cart, user=user, settings=settings, daily_counts=daily_counts, status="skipped", error="missing_phone")
         return "cancelled"
 
     if in_quiet_hours(user=user, now=now, settings=settings):
@@ -141,10 +145,10 @@ def process_single_job(
         reschedule_job(job_id=str(job["id"]), attempt=int(job.get("attempt", 0)), next_run=next_run, voice_repository=voice_service.voice_repository)
         return "retried"
 
-    budget_decision = budget_and_cap_guardrails(user_id=user_id, settings=settings, now=now, voice_service=voice_service)
+    budget_decision = budget_and_cap_guardrails(user_id=user_id, settings=settings, daily_counts=daily_counts)
     if budget_decision != "ok":
         complete_job(job_id=str(job["id"]), status="cancelled", error=budget_decision, voice_repository=voice_service.voice_repository)
-        voice_service._record_call_event(job=job, cart=cart, user=user, status="skipped", error=budget_decision)
+        voice_service._record_call_event(job=job, cart=cart, user=user, settings=settings, daily_counts=daily_counts, status="skipped", error=budget_decision)
         append_alert(
             code="VOICE_GUARDRAIL_TRIGGERED",
             message=f"Voice call blocked by guardrail: {budget_decision}",
@@ -155,8 +159,8 @@ def process_single_job(
         return "cancelled"
 
     campaign = build_campaign_payload(user=user, cart=cart, settings=settings, default_template=voice_service.settings.voice_script_template)
-    assistant_id = str(settings.get("assistantId", "")).strip() or None
-    from_phone_number = str(settings.get("fromPhoneNumber", "")).strip() or None
+    assistant_id = settings.assistant_id or None
+    from_phone_number = settings.from_phone_number or None
     attempt_number = int(job.get("attempt", 0)) + 1
 
     if not voice_service.superu_client.enabled:
@@ -165,6 +169,8 @@ def process_single_job(
             job=job,
             cart=cart,
             user=user,
+            settings=settings,
+            daily_counts=daily_counts,
             status="skipped",
             error="provider_not_configured",
             request_payload=campaign,
@@ -182,6 +188,8 @@ def process_single_job(
             job=job,
             cart=cart,
             user=user,
+            settings=settings,
+            daily_counts=daily_counts,
             status="skipped",
             error="provider_not_configured",
             request_payload=campaign,
@@ -212,6 +220,8 @@ def process_single_job(
             job=job,
             cart=cart,
             user=user,
+            settings=settings,
+            daily_counts=daily_counts,
             status="initiated",
             error=None,
             request_payload=campaign,
@@ -219,17 +229,18 @@ def process_single_job(
             provider_call_id=provider_call_id,
             attempt_number=attempt_number,
         )
-        # Idempotency is handled by checking existing_keys in enqueue_abandoned_cart_jobs
+        # Idempotency is handled by the recoveryKey lookup in enqueue_abandoned_cart_jobs
         return "completed"
     except RuntimeError as exc:
         error = str(exc)
-        max_attempts = max(1, int(settings.get("maxAttemptsPerCart", 3)))
-        if attempt_number >= max_attempts:
+        if attempt_number >= settings.max_attempts_per_cart:
             complete_job(job_id=str(job["id"]), status="dead_letter", error=error, voice_repository=voice_service.voice_repository)
             voice_service._record_call_event(
                 job=job,
                 cart=cart,
                 user=user,
+                settings=settings,
+                daily_counts=daily_counts,
                 status="failed",
                 error=error,
                 request_payload=campaign,
@@ -244,7 +255,7 @@ def process_single_job(
             )
             return "deadLetter"
 
-        backoffs = normalize_backoff_list(settings.get("retryBackoffSeconds"))
+        backoffs = settings.retry_backoff_seconds
         delay = backoffs[min(attempt_number - 1, len(backoffs) - 1)]
         next_run = now + timedelta(seconds=delay)
         reschedule_job(job_id=str(job["id"]), attempt=attempt_number, next_run=next_run, error=error, voice_repository=voice_service.voice_repository)
@@ -252,6 +263,8 @@ def process_single_job(
             job=job,
             cart=cart,
             user=user,
+            settings=settings,
+            daily_counts=daily_counts,
             status="retrying",
             error=error,
             request_payload=campaign,
@@ -268,25 +281,21 @@ def reschedule_job(
     voice_repository: VoiceRepository,
     error: str | None = None,
 ) -> None:
-    current = voice_repository.get_job(job_id)
-    if current is None:
-        return
-    updated = deepcopy(current)
-    updated["status"] = "retrying"
-    updated["attempt"] = max(0, int(attempt))
-    updated["nextRunAt"] = next_run.isoformat()
-    updated["lastError"] = error
-    updated["updatedAt"] = iso_now()
-    voice_repository.upsert_job(updated)
+    # Job status transitions only touch a handful of fields; $set them in
+    # place rather than reading and rewriting the whole job document.
+    voice_repository.update_job(
+        job_id,
+        {
+            "status": "retrying",
+            "attempt": max(0, int(attempt)),
+            "nextRunAt": next_run.isoformat(),
+            "lastError": error,
+            "updatedAt": iso_now(),
+        },
+    )
 
 def complete_job(*, job_id: str, status: str, error: str | None, voice_repository: VoiceRepository) -> None:
-    current = voice_repository.get_job(job_id)
-    if current is None:
-        return
-    updated = deepcopy(current)
-    updated["status"] = status
-    updated["lastError"] = error
-    updated["updatedAt"] = iso_now()
+    fields: dict[str, Any] = {"status": status, "lastError": error, "updatedAt": iso_now()}
     if status in {"completed", "cancelled", "dead_letter"}:
-        updated["nextRunAt"] = None
-    voice_repository.upsert_job(updated)
+        fields["nextRunAt"] = None
+    voice_repository.update_job(job_id, fields)
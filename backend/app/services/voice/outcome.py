@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Any
 
+from app.core.utils import canon
+
 def apply_outcome_actions(
     *,
     call: dict[str, Any],
@@ -8,13 +10,13 @@ def apply_outcome_actions(
     support_service: Any,
     notification_service: Any,
 ) -> None:
-    user_id = str(call.get("userId", "")).strip()
-    session_id = str(call.get("sessionId", "")).strip() or "voice-session"
+    user_id = canon(call.get("userId"))
+    session_id = canon(call.get("sessionId")) or "voice-session"
     if not user_id:
         return
 
-    outcome = str(call.get("outcome", "")).strip().lower()
-    status = str(call.get("status", "")).strip().lower()
+    outcome = canon(call.get("outcome"))
+    status = canon(call.get("status"))
 
     if outcome in {"do_not_call", "opt_out", "dnc"}:
         voice_service.suppress_user(user_id=user_id, reason="voice_opt_out")
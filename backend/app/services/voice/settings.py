@@ -1,9 +1,60 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Mapping
 from app.services.voice.helpers import normalize_backoff_list
 from app.repositories.voice_repository import VoiceRepository
 
+@dataclass(frozen=True, slots=True)
+class VoiceSettings:
+    """Typed voice settings, parsed once per scheduler tick.
+
+    The stored document stays the camelCase dict that the admin API reads and
+    writes; the scheduler converts it here so guardrails and job handlers read
+    attributes instead of repeating ``.get`` plus a cast on every job.
+    """
+
+    enabled: bool = False
+    kill_switch: bool = False
+    abandonment_minutes: int = 30
+    max_attempts_per_cart: int = 3
+    max_calls_per_user_per_day: int = 0
+    max_calls_per_day: int = 0
+    daily_budget_usd: float = 0.0
+    estimated_cost_per_call_usd: float = 0.0
+    quiet_hours_start: int = 21
+    quiet_hours_end: int = 8
+    retry_backoff_seconds: tuple[int, ...] = (60, 300, 900)
+    script_version: str = "v1"
+    script_template: str = ""
+    assistant_id: str = ""
+    from_phone_number: str = ""
+    default_timezone: str = "UTC"
+    alert_backlog_threshold: int = 50
+    alert_failure_ratio_threshold: float = 0.35
+
+    @classmethod
+    def from_document(cls, row: Mapping[str, Any]) -> VoiceSettings:
+        return cls(
+            enabled=bool(row.get("enabled", False)),
+            kill_switch=bool(row.get("killSwitch", False)),
+            abandonment_minutes=int(row.get("abandonmentMinutes", 30)),
+            max_attempts_per_cart=max(1, int(row.get("maxAttemptsPerCart", 3))),
+            max_calls_per_user_per_day=int(row.get("maxCallsPerUserPerDay", 0)),
+            max_calls_per_day=int(row.get("maxCallsPerDay", 0)),
+            daily_budget_usd=float(row.get("dailyBudgetUsd", 0.0)),
+            estimated_cost_per_call_usd=float(row.get("estimatedCostPerCallUsd", 0.0)),
+            quiet_hours_start=int(row.get("quietHoursStart", 21)),
+            quiet_hours_end=int(row.get("quietHoursEnd", 8)),
+            retry_backoff_seconds=tuple(normalize_backoff_list(row.get("retryBackoffSeconds"))),
+            script_version=str(row.get("scriptVersion", "v1")),
+            script_template=str(row.get("scriptTemplate", "")),
+            assistant_id=str(row.get("assistantId", "")).strip(),
+            from_phone_number=str(row.get("fromPhoneNumber", "")).strip(),
+            default_timezone=str(row.get("defaultTimezone", "UTC")).strip(),
+            alert_backlog_threshold=int(row.get("alertBacklogThreshold", 50)),
+            alert_failure_ratio_threshold=float(row.get("alertFailureRatioThreshold", 0.35)),
+        )
+
 def get_settings(voice_repository: VoiceRepository) -> dict[str, Any]:
     settings = voice_repository.get_settings()
     return settings or {}
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 from app.core.config import Settings
-from app.core.utils import generate_id, iso_now, utc_now
+from app.core.utils import canon, generate_id, iso_now, utc_now
 from app.infrastructure.superu_client import SuperUClient
 from app.services.notification_service import NotificationService
 from app.services.support_service import SupportService
-from app.repositories.voice_repository import VoiceRepository
+from app.repositories.voice_repository import CallRecord, VoiceRepository
 from app.repositories.auth_repository import AuthRepository
 from app.repositories.cart_repository import CartRepository
 from app.repositories.order_repository import OrderRepository
@@ -44,7 +44,17 @@ class VoiceRecoveryService:
 
     def process_due_work(self) -> dict[str, Any]:
         now = utc_now()
-        settings = self.get_settings()
+        # Parsed once and frozen: every helper below shares this one settings
+        # read instead of re-reading and re-casting fields per job.
+        settings = voice_settings.VoiceSettings.from_document(self.get_settings())
+        if not settings.enabled:
+            return {
+                "enqueued": 0,
+                "processed": {"completed": 0, "retried": 0, "deadLetter": 0, "cancelled": 0},
+                "polled": 0,
+                "alertsGenerated": 0,
+                "settingsEnabled": False,
+            }
         enqueued = voice_jobs.enqueue_abandoned_cart_jobs(
             now=now,
             voice_repository=self.voice_repository,
@@ -53,7 +63,11 @@ class VoiceRecoveryService:
             voice_service=self,
         )
         processed = voice_jobs.process_due_jobs(
-            now=now, voice_repository=self.voice_repository, voice_service=self
+            now=now,
+            voice_repository=self.voice_repository,
+            voice_service=self,
+            settings=settings,
+            suppressed=self._suppressed_users(),
         )
         polled = self._poll_provider_updates(now=now)
         generated_alerts = voice_alerts.evaluate_alerts(
@@ -64,7 +78,7 @@ class VoiceRecoveryService:
             "processed": processed,
             "polled": polled,
             "alertsGenerated": generated_alerts,
-            "settingsEnabled": bool(settings.get("enabled", False)),
+            "settingsEnabled": True,
         }
 
     def get_settings(self) -> dict[str, Any]:
@@ -100,7 +114,7 @@ class VoiceRecoveryService:
     def stats(self) -> dict[str, Any]:
         return voice_alerts.get_stats(
             now=utc_now(),
-            settings=self.get_settings(),
+            settings=voice_settings.VoiceSettings.from_document(self.get_settings()),
             voice_service=self,
         )
 
@@ -109,22 +123,31 @@ class VoiceRecoveryService:
             return 0
         
         active_calls = [
-            call for call in self.voice_repository.list_calls(limit=1000)
-            if str(call.get("status", "")) in {"initiated", "ringing", "in_progress"}
-            and str(call.get("providerCallId", "")).strip()
+            call
+            for call in self.voice_repository.list_call_records(
+                statuses=voice_helpers.ACTIVE_CALL_STATUSES, limit=1000
+            )
+            if call.provider_call_id
         ]
         
+        if not active_calls:
+            return 0
+
+        # Each poll is an HTTP round trip; fetch them concurrently and apply
+        # the results serially so repository writes stay on this thread.
+        max_workers = max(1, min(len(active_calls), self.settings.voice_poll_max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._fetch_latest_call_logs, active_calls))
+
         updates = 0
-        for call in active_calls:
-            provider_call_id = str(call.get("providerCallId", "")).strip()
-            try:
-                rows = self.superu_client.fetch_call_logs(call_id=provider_call_id, limit=1)
-            except RuntimeError as exc:
+        for call, rows in zip(active_calls, results):
+            provider_call_id = call.provider_call_id
+            if isinstance(rows, RuntimeError):
                 voice_alerts.append_alert(
                     code="VOICE_POLL_FAILED",
-                    message=f"Failed to poll SuperU call logs: {exc}",
+                    message=f"Failed to poll SuperU call logs: {rows}",
                     severity="warning",
-                    details={"callId": call.get("id"), "providerCallId": provider_call_id},
+                    details={"callId": call.id, "providerCallId": provider_call_id},
                     voice_repository=self.voice_repository,
                 )
                 continue
@@ -136,7 +159,7 @@ class VoiceRecoveryService:
             if normalized_status in {"completed", "failed"}:
                 voice_calls.update_call_terminal(
                     voice_repository=self.voice_repository,
-                    call_id=str(call["id"]),
+                    call_id=call.id,
                     status=normalized_status,
                     outcome=outcome,
                     payload=latest,
@@ -146,13 +169,19 @@ class VoiceRecoveryService:
             elif normalized_status in {"ringing", "in_progress"}:
                 voice_calls.update_call_progress(
                     voice_repository=self.voice_repository,
-                    call_id=str(call["id"]),
+                    call_id=call.id,
                     status=normalized_status,
                     payload=latest,
                 )
                 updates += 1
         return updates
 
+    def _fetch_latest_call_logs(self, call: CallRecord) -> list[dict[str, Any]] | RuntimeError:
+        try:
+            return self.superu_client.fetch_call_logs(call_id=call.provider_call_id, limit=1)
+        except RuntimeError as exc:
+            return exc
+
     def ingest_provider_callback(self, *, payload: dict[str, Any]) -> dict[str, Any]:
         provider_call_id = voice_helpers.extract_provider_call_id(payload)
         if not provider_call_id:
@@ -163,15 +192,8 @@ class VoiceRecoveryService:
                 "reason": "missing_provider_call_id",
             }
 
-        matched_call_id: str | None = None
-        # Efficient lookup by provider_call_id would be better
-        # For now, list recent calls.
-        calls = self.voice_repository.list_calls(limit=1000)
-        for call in calls:
-            if str(call.get("providerCallId", "")).strip() == provider_call_id:
-                matched_call_id = str(call.get("id", "")).strip() or None
-                break
-                
+        current = self.voice_repository.find_call_by_provider_id(provider_call_id)
+        matched_call_id = (canon(current.get("id")) or None) if current else None
         if not matched_call_id:
             return {
                 "accepted": True,
@@ -182,22 +204,8 @@ class VoiceRecoveryService:
             }
 
         event_key = voice_helpers.provider_event_key(payload, self.superu_client)
-        current = self.voice_repository.get_call(matched_call_id)
-        if not isinstance(current, dict):
-            return {
-                "accepted": True,
-                "matched": False,
-                "idempotent": False,
-                "reason": "call_not_found",
-                "providerCallId": provider_call_id,
-            }
-
-        seen_keys = {
-            str(value).strip()
-            for value in current.get("providerEventKeys", [])
-            if isinstance(value, str) and value.strip()
-        }
-        if event_key in seen_keys:
+        seen_keys = current.get("providerEventKeys")
+        if isinstance(seen_keys, list) and event_key in seen_keys:
             return {
                 "accepted": True,
                 "matched": True,
@@ -210,6 +218,23 @@ class VoiceRecoveryService:
 
         normalized_status = voice_helpers.normalize_provider_status(payload)
         outcome = voice_helpers.extract_outcome(payload)
+
+        keys = seen_keys if isinstance(seen_keys, list) else []
+        keys.append(event_key)
+        current["providerEventKeys"] = keys[-200:]
+        events = current.get("providerEvents")
+        if not isinstance(events, list):
+            events = []
+        events.append(
+            {
+                "key": event_key,
+                "status": normalized_status,
+                "outcome": outcome,
+                "receivedAt": iso_now(),
+            }
+        )
+        current["providerEvents"] = events[-200:]
+
         if normalized_status in {"completed", "failed"}:
             voice_calls.update_call_terminal(
                 voice_repository=self.voice_repository,
@@ -218,6 +243,7 @@ class VoiceRecoveryService:
                 outcome=outcome,
                 payload=payload,
                 voice_service=self,
+                call=current,
             )
         else:
             voice_calls.update_call_progress(
@@ -225,38 +251,9 @@ class VoiceRecoveryService:
                 call_id=matched_call_id,
                 status=normalized_status,
                 payload=payload,
+                call=current,
             )
 
-        latest = self.voice_repository.get_call(matched_call_id)
-        if isinstance(latest, dict):
-            keys = [
-                str(value).strip()
-                for value in latest.get("providerEventKeys", [])
-                if isinstance(value, str) and value.strip()
-            ]
-            if event_key not in keys:
-                keys.append(event_key)
-            if len(keys) > 200:
-                keys = keys[-200:]
-            latest["providerEventKeys"] = keys
-
-            events = latest.get("providerEvents", [])
-            if not isinstance(events, list):
-                events = []
-            events.append(
-                {
-                    "key": event_key,
-                    "status": normalized_status,
-                    "outcome": outcome,
-                    "receivedAt": iso_now(),
-                }
-            )
-            if len(events) > 200:
-                events = events[-200:]
-            latest["providerEvents"] = events
-            latest["updatedAt"] = iso_now()
-            self.voice_repository.upsert_call(latest)
-
         return {
             "accepted": True,
             "matched": True,
@@ -268,13 +265,13 @@ class VoiceRecoveryService:
         }
 
     def _record_call_event(self, **kwargs: Any) -> None:
-        voice_calls.record_call_event(voice_repository=self.voice_repository, voice_service=self, **kwargs)
+        voice_calls.record_call_event(voice_repository=self.voice_repository, **kwargs)
 
     def _get_user(self, user_id: Any) -> dict[str, Any] | None:
         key = str(user_id or "").strip()
         if not key:
             return None
-        return self.user_repository.get_by_id(key)
+        return self.user_repository.get_user_by_id(key)
 
     def _get_cart(self, cart_id: Any) -> dict[str, Any] | None:
         key = str(cart_id or "").strip()
@@ -283,15 +280,13 @@ class VoiceRecoveryService:
         return self.cart_repository.get_by_id(key)
 
     def _has_newer_order(self, *, user_id: str, since: datetime) -> bool:
-        orders = self.order_repository.list_all()
-        for order in orders:
-            if str(order.get("userId", "")) != user_id:
-                continue
+        # list_by_user is served by the (userId, createdAt desc) index, so the
+        # first order with a parseable timestamp is the user's latest one.
+        for order in self.order_repository.list_by_user(user_id):
             created_at = voice_helpers.parse_iso(order.get("createdAt"))
-            if created_at and created_at > since:
-                return True
+            if created_at is not None:
+                return created_at > since
         return False
 
-    def _suppressed_users(self) -> set[str]:
-        suppressions = self.voice_repository.list_suppressions()
-        return {str(s.get("userId")) for s in suppressions}
+    def _suppressed_users(self) -> frozenset[str]:
+        return self.voice_repository.get_suppressed_user_ids()
@@ -1,13 +1,187 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import sys
 from datetime import datetime, timedelta, timezone
-from threading import RLock
+from functools import lru_cache
+from threading import Lock
 from typing import Any
 
+import orjson
+
 from app.core.security import hash_password
 
 
+# Encoded once at import; each store decodes a fresh, unaliased copy.
+_SEED_PRODUCTS_JSON = orjson.dumps(
+    [
+        {
+            "id": "prod_001",
+            "name": "Running Shoes Pro",
+            "description": "High-performance running shoes for daily training.",
+            "category": "shoes",
+            "subcategory": "running",
+            "brand": "StrideForge",
+            "price": 129.99,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Running+Shoe"],
+
+            "variants": [
+                {"id": "var_001", "size": "10", "color": "blue", "inStock": True},
+                {"id": "var_002", "size": "10", "color": "black", "inStock": True},
+            ],
+            "rating": 4.5,
+            "reviewCount": 234,
+            "tags": ["running", "daily-trainer"],
+            "features": ["lightweight", "breathable", "shock-absorption"],
+            "specifications": {"material": "engineered mesh", "weightOz": 9.6},
+            "status": "active",
+        },
+        {
+            "id": "prod_002",
+            "name": "Trail Runner X",
+            "description": "Grip-focused trail shoes with reinforced toe box.",
+            "category": "shoes",
+            "subcategory": "trail",
+            "brand": "PeakRoute",
+            "price": 149.99,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Classic+T-Shirt"],
+
+            "variants": [
+                {"id": "var_003", "size": "9", "color": "green", "inStock": True},
+                {"id": "var_004", "size": "10", "color": "gray", "inStock": False},
+            ],
+            "rating": 4.3,
+            "reviewCount": 157,
+            "tags": ["trail", "outdoor"],
+            "features": ["high-traction", "toe-protection"],
+            "specifications": {"material": "synthetic textile", "weightOz": 10.4},
+            "status": "active",
+        },
+        {
+            "id": "prod_003",
+            "name": "Performance Hoodie",
+            "description": "Lightweight hoodie built for active movement.",
+            "category": "clothing",
+            "subcategory": "tops",
+            "brand": "AeroThread",
+            "price": 79.99,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Denim+Jacket"],
+
+            "variants": [
+                {"id": "var_005", "size": "M", "color": "navy", "inStock": True},
+                {"id": "var_006", "size": "L", "color": "black", "inStock": True},
+            ],
+            "rating": 4.2,
+            "reviewCount": 88,
+            "tags": ["hoodie", "training"],
+            "features": ["moisture-wicking", "four-way-stretch"],
+            "specifications": {"material": "poly-spandex blend"},
+            "status": "active",
+        },
+        {
+            "id": "prod_004",
+            "name": "Everyday Joggers",
+            "description": "Soft stretch joggers for training and recovery.",
+            "category": "clothing",
+            "subcategory": "bottoms",
+            "brand": "AeroThread",
+            "price": 64.5,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Yoga+Mat"],
+
+            "variants": [
+                {"id": "var_007", "size": "M", "color": "charcoal", "inStock": True},
+                {"id": "var_008", "size": "L", "color": "charcoal", "inStock": True},
+            ],
+            "rating": 4.1,
+            "reviewCount": 73,
+            "tags": ["joggers", "recovery"],
+            "features": ["soft-touch", "elastic-waist"],
+            "specifications": {"material": "cotton blend"},
+            "status": "active",
+        },
+        {
+            "id": "prod_005",
+            "name": "Support Socks Pack",
+            "description": "Compression support socks, 3-pack.",
+            "category": "accessories",
+            "subcategory": "socks",
+            "brand": "StrideForge",
+            "price": 24.99,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Coffee+Maker"],
+
+            "variants": [
+                {"id": "var_009", "size": "M", "color": "white", "inStock": True},
+                {"id": "var_010", "size": "L", "color": "white", "inStock": True},
+            ],
+            "rating": 4.0,
+            "reviewCount": 44,
+            "tags": ["compression", "recovery"],
+            "features": ["arch-support"],
+            "specifications": {"packSize": 3},
+            "status": "active",
+        },
+        {
+            "id": "prod_006",
+            "name": "Training Backpack",
+            "description": "Water-resistant backpack with shoe compartment.",
+            "category": "accessories",
+            "subcategory": "bags",
+            "brand": "CarryWorks",
+            "price": 89.0,
+            "currency": "USD",
+            "images": ["https://placehold.co/600x800?text=Wireless+Earbuds"],
+
+            "variants": [
+                {"id": "var_011", "size": "one-size", "color": "black", "inStock": True}
+            ],
+            "rating": 4.6,
+            "reviewCount": 102,
+            "tags": ["backpack", "gym"],
+            "features": ["water-resistant", "shoe-compartment"],
+            "specifications": {"capacityLiters": 24},
+            "status": "active",
+        },
+    ]
+)
+
+# orjson would otherwise encode these as strings or plain dicts, which is just
+# as lossy as default=str; pass them through so they raise instead.
+_SNAPSHOT_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+@lru_cache(maxsize=1)
+def _admin_password_hash() -> str:
+    # PBKDF2 is deliberately slow; every store seeds the same admin password,
+    # so derive it once per process rather than once per store construction.
+    return hash_password("AdminPass123!")
+
+
+class _IdCounter:
+    """Monotonic id sequence with its own lock, independent of the store lock.
+
+    A lock-free ``itertools.count`` plus a separately tracked high-water mark
+    let ``value`` go stale between issue and store, so ``export_state`` could
+    snapshot a counter behind ids already handed out. The per-counter lock
+    keeps ``value`` equal to the last id issued; it is held only for the
+    increment, so ``next_id`` never contends with the store-wide lock.
+    """
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, start: int = 0) -> None:
+        self._lock = Lock()
+        self.value = start
+
+    def next(self) -> int:
+        with self._lock:
+            self.value += 1
+            return self.value
+
+
 class InMemoryStore:
     STATE_KEYS = (
         "users_by_id",
@@ -34,14 +208,10 @@ class InMemoryStore:
     )
 
     def __init__(self) -> None:
-        self.lock = RLock()
+        self.lock = Lock()
         self._counters = {
-            "user": 0,
-            "session": 0,
-            "cart": 0,
-            "order": 0,
-            "item": 0,
-            "payment": 0,
+            prefix: _IdCounter()
+            for prefix in ("user", "session", "cart", "order", "item", "payment")
         }
 
         self.users_by_id: dict[str, dict[str, Any]] = {}
@@ -68,9 +238,7 @@ class InMemoryStore:
         self._seed_admin_user()
 
     def next_id(self, prefix: str) -> str:
-        with self.lock:
-            self._counters[prefix] += 1
-            return f"{prefix}_{self._counters[prefix]:06d}"
+        return f"{prefix}_{self._counters[prefix].next():06d}"
 
     @staticmethod
     def utc_now() -> datetime:
@@ -85,143 +253,12 @@ class InMemoryStore:
         return (InMemoryStore.utc_now() + timedelta(minutes=minutes)).isoformat()
 
     def _seed_products(self) -> dict[str, dict[str, Any]]:
-        raw = [
-            {
-                "id": "prod_001",
-                "name": "Running Shoes Pro",
-                "description": "High-performance running shoes for daily training.",
-                "category": "shoes",
-                "subcategory": "running",
-                "brand": "StrideForge",
-                "price": 129.99,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Running+Shoe"],
-
-                "variants": [
-                    {"id": "var_001", "size": "10", "color": "blue", "inStock": True},
-                    {"id": "var_002", "size": "10", "color": "black", "inStock": True},
-                ],
-                "rating": 4.5,
-                "reviewCount": 234,
-                "tags": ["running", "daily-trainer"],
-                "features": ["lightweight", "breathable", "shock-absorption"],
-                "specifications": {"material": "engineered mesh", "weightOz": 9.6},
-                "status": "active",
-            },
-            {
-                "id": "prod_002",
-                "name": "Trail Runner X",
-                "description": "Grip-focused trail shoes with reinforced toe box.",
-                "category": "shoes",
-                "subcategory": "trail",
-                "brand": "PeakRoute",
-                "price": 149.99,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Classic+T-Shirt"],
-
-                "variants": [
-                    {"id": "var_003", "size": "9", "color": "green", "inStock": True},
-                    {"id": "var_004", "size": "10", "color": "gray", "inStock": False},
-                ],
-                "rating": 4.3,
-                "reviewCount": 157,
-                "tags": ["trail", "outdoor"],
-                "features": ["high-traction", "toe-protection"],
-                "specifications": {"material": "synthetic textile", "weightOz": 10.4},
-                "status": "active",
-            },
-            {
-                "id": "prod_003",
-                "name": "Performance Hoodie",
-                "description": "Lightweight hoodie built for active movement.",
-                "category": "clothing",
-                "subcategory": "tops",
-                "brand": "AeroThread",
-                "price": 79.99,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Denim+Jacket"],
-
-                "variants": [
-                    {"id": "var_005", "size": "M", "color": "navy", "inStock": True},
-                    {"id": "var_006", "size": "L", "color": "black", "inStock": True},
-                ],
-                "rating": 4.2,
-                "reviewCount": 88,
-                "tags": ["hoodie", "training"],
-                "features": ["moisture-wicking", "four-way-stretch"],
-                "specifications": {"material": "poly-spandex blend"},
-                "status": "active",
-            },
-            {
-                "id": "prod_004",
-                "name": "Everyday Joggers",
-                "description": "Soft stretch joggers for training and recovery.",
-                "category": "clothing",
-                "subcategory": "bottoms",
-                "brand": "AeroThread",
-                "price": 64.5,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Yoga+Mat"],
-
-                "variants": [
-                    {"id": "var_007", "size": "M", "color": "charcoal", "inStock": True},
-                    {"id": "var_008", "size": "L", "color": "charcoal", "inStock": True},
-                ],
-                "rating": 4.1,
-                "reviewCount": 73,
-                "tags": ["joggers", "recovery"],
-                "features": ["soft-touch", "elastic-waist"],
-                "specifications": {"material": "cotton blend"},
-                "status": "active",
-            },
-            {
-                "id": "prod_005",
-                "name": "Support Socks Pack",
-                "description": "Compression support socks, 3-pack.",
-                "category": "accessories",
-                "subcategory": "socks",
-                "brand": "StrideForge",
-                "price": 24.99,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Coffee+Maker"],
-
-                "variants": [
-                    {"id": "var_009", "size": "M", "color": "white", "inStock": True},
-                    {"id": "var_010", "size": "L", "color": "white", "inStock": True},
-                ],
-                "rating": 4.0,
-                "reviewCount": 44,
-                "tags": ["compression", "recovery"],
-                "features": ["arch-support"],
-                "specifications": {"packSize": 3},
-                "status": "active",
-            },
-            {
-                "id": "prod_006",
-                "name": "Training Backpack",
-                "description": "Water-resistant backpack with shoe compartment.",
-                "category": "accessories",
-                "subcategory": "bags",
-                "brand": "CarryWorks",
-                "price": 89.0,
-                "currency": "USD",
-                "images": ["https://placehold.co/600x800?text=Wireless+Earbuds"],
-
-                "variants": [
-                    {"id": "var_011", "size": "one-size", "color": "black", "inStock": True}
-                ],
-                "rating": 4.6,
-                "reviewCount": 102,
-                "tags": ["backpack", "gym"],
-                "features": ["water-resistant", "shoe-compartment"],
-                "specifications": {"capacityLiters": 24},
-                "status": "active",
-            },
-        ]
-        return {item["id"]: deepcopy(item) for item in raw}
+        # orjson hands back fresh key strings; intern the ids so lookups keyed on
+        # them compare by identity.
+        return {sys.intern(item["id"]): item for item in orjson.loads(_SEED_PRODUCTS_JSON)}
 
     def _seed_categories(self) -> dict[str, dict[str, Any]]:
-        names = sorted({str(row.get("category", "")).strip().lower() for row in self.products_by_id.values() if row.get("category")})
+        names = sorted({sys.intern(str(row.get("category", "")).strip().lower()) for row in self.products_by_id.values() if row.get("category")})
         now = self.iso_now()
         output: dict[str, dict[str, Any]] = {}
         for name in names:
@@ -238,16 +275,18 @@ class InMemoryStore:
 
     def _seed_inventory(self) -> dict[str, dict[str, Any]]:
         inventory: dict[str, dict[str, Any]] = {}
+        now = self.iso_now()
         for product in self.products_by_id.values():
             for variant in product["variants"]:
                 base_qty = 200 if variant.get("inStock", False) else 0
-                inventory[variant["id"]] = {
-                    "variantId": variant["id"],
+                variant_id = sys.intern(variant["id"])
+                inventory[variant_id] = {
+                    "variantId": variant_id,
                     "productId": product["id"],
                     "totalQuantity": base_qty,
                     "reservedQuantity": 0,
                     "availableQuantity": base_qty,
-                    "updatedAt": self.iso_now(),
+                    "updatedAt": now,
                 }
         return inventory
 
@@ -258,7 +297,7 @@ class InMemoryStore:
             "id": admin_id,
             "email": "admin@example.com",
             "name": "Platform Admin",
-            "passwordHash": hash_password("AdminPass123!"),
+            "passwordHash": _admin_password_hash(),
             "role": "admin",
             "status": "active",
             "identity": {"anonymousId": None, "linkedChannels": []},
@@ -297,19 +336,25 @@ class InMemoryStore:
         }
 
     def export_state(self) -> dict[str, Any]:
+        # Serialise under the lock and parse outside it: the snapshot is still
+        # fully detached from live state, but the critical section is a single
+        # C-level orjson.dumps instead of a recursive deepcopy of every key.
+        # Values that JSON cannot round-trip (datetime, set, Decimal, non-str
+        # keys) raise TypeError here rather than coming back as strings.
         with self.lock:
-            state = {"_counters": deepcopy(self._counters)}
-            for key in self.STATE_KEYS:
-                state[key] = deepcopy(getattr(self, key))
-            return state
+            counters = {prefix: counter.value for prefix, counter in self._counters.items()}
+            raw = {"_counters": counters, **{key: getattr(self, key) for key in self.STATE_KEYS}}
+            blob = orjson.dumps(raw, option=_SNAPSHOT_OPTIONS)
+        return orjson.loads(blob)
 
     def import_state(self, state: dict[str, Any]) -> None:
+        state = orjson.loads(orjson.dumps(state, option=_SNAPSHOT_OPTIONS))
         with self.lock:
             counters = state.get("_counters")
             if isinstance(counters, dict):
-                self._counters.update({k: int(v) for k, v in counters.items()})
+                self._counters.update({k: _IdCounter(int(v)) for k, v in counters.items()})
 
             for key in self.STATE_KEYS:
                 value = state.get(key)
                 if value is not None:
-                    setattr(self, key, deepcopy(value))
+                    setattr(self, key, value)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import uuid
+from itertools import count
 
-from locust import HttpUser, between, task
+from locust import between, task
+from locust.contrib.fasthttp import FastHttpUser
 
 
-class CommerceUser(HttpUser):
+class CommerceUser(FastHttpUser):
     wait_time = between(0.2, 1.2)
 
     def on_start(self) -> None:
@@ -15,6 +16,11 @@ class CommerceUser(HttpUser):
         )
         response.raise_for_status()
         self.session_id = response.json()["sessionId"]
+        # Built once per simulated user and shared by every task.
+        self.session_headers = {"X-Session-Id": self.session_id}
+        # Session ids are already unique per user, so a local counter is enough
+        # to keep registration emails unique without an RNG call per task.
+        self.registration_numbers = count(1)
 
     @task(4)
     def browse_products(self) -> None:
@@ -37,12 +43,12 @@ class CommerceUser(HttpUser):
         add = self.client.post(
             "/v1/cart/items",
             name="POST /v1/cart/items",
-            headers={"X-Session-Id": self.session_id},
+            headers=self.session_headers,
             json={"productId": "prod_001", "variantId": "var_001", "quantity": 1},
         )
         if add.status_code >= 400:
             return
-        cart = self.client.get("/v1/cart", name="GET /v1/cart", headers={"X-Session-Id": self.session_id})
+        cart = self.client.get("/v1/cart", name="GET /v1/cart", headers=self.session_headers)
         if cart.status_code >= 400:
             return
         items = cart.json().get("items", [])
@@ -54,16 +60,16 @@ class CommerceUser(HttpUser):
         self.client.delete(
             f"/v1/cart/items/{item_id}",
             name="DELETE /v1/cart/items/{item_id}",
-            headers={"X-Session-Id": self.session_id},
+            headers=self.session_headers,
         )
 
     @task(1)
     def register_user_flow(self) -> None:
-        email = f"load-{uuid.uuid4().hex[:10]}@example.com"
+        email = f"load-{self.session_id}-{next(self.registration_numbers)}@example.com"
         self.client.post(
             "/v1/auth/register",
             name="POST /v1/auth/register",
-            headers={"X-Session-Id": self.session_id},
+            headers=self.session_headers,
             json={
                 "email": email,
                 "password": "SecurePass123!",
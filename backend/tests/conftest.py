@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import pytest
 import os
-from app.container import container
+from urllib.parse import urlsplit, urlunsplit
+from uuid import uuid4
+from fastapi.testclient import TestClient
+import app.services.auth_service as auth_service
+from app.container import container, llm_client
+from app.core.security import verify_password
+from app.infrastructure.mongo_indexes import ensure_mongo_indexes, resolve_database
+from app.main import app
 from pymongo import MongoClient
 import redis
 
+def _with_path(url: str, path: str) -> str:
+    return urlunsplit(urlsplit(url)._replace(path=path))
+
 @pytest.fixture(scope="session", autouse=True)
 def init_test_services():
     mongodb_uri = os.environ.get("MONGODB_URI", "mongodb://localhost:27017/commerce_test")
     redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/1")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        # pytest-xdist workers each wipe their stores at session start, so give
+        # every worker its own Mongo database and Redis db.
+        worker_index = int(worker.removeprefix("gw"))
+        mongodb_uri = _with_path(mongodb_uri, f"{urlsplit(mongodb_uri).path}_{worker}")
+        # A default Redis server only has dbs 0-15, so wrap rather than ask for
+        # a db that does not exist and silently run that worker without Redis.
+        redis_db = (int(urlsplit(redis_url).path.strip("/") or 0) + worker_index) % 16
+        redis_url = _with_path(redis_url, f"/{redis_db}")
     container.mongo_manager.uri = mongodb_uri
     container.mongo_manager.enabled = True
     container.redis_manager.url = redis_url
@@ -20,9 +41,13 @@ def init_test_services():
     
     # Clean DB before tests
     if container.mongo_manager.client:
-        container.mongo_manager.client.drop_database("commerce_test")
+        container.mongo_manager.client.drop_database(resolve_database(container.mongo_manager.client).name)
+        # Tests never run the app lifespan, so build the indexes up front rather
+        # than leaving every query in the session to scan unindexed collections.
+        ensure_mongo_indexes(client=container.mongo_manager.client)
     if container.redis_manager.client:
         container.redis_manager.client.flushdb()
+        container.redis_manager.client.ping()
     
     yield
     if getattr(container.mongo_manager, "client", None):
@@ -30,6 +55,85 @@ def init_test_services():
     if getattr(container.redis_manager, "client", None):
         container.redis_manager.client.close()
 
+@pytest.fixture(scope="session")
+def shared_client(init_test_services) -> TestClient:
+    # Built without entering the context manager, as the tests always have been,
+    # so the app lifespan (scheduler, container start) still never runs here.
+    return TestClient(app)
+
+@pytest.fixture
+def client(shared_client: TestClient) -> TestClient:
+    # One client for the whole session; only its cookie jar is per-test.
+    shared_client.cookies.clear()
+    return shared_client
+
+@pytest.fixture(scope="session")
+def admin_token(shared_client: TestClient) -> str:
+    # Login verifies the admin password hash, which is deliberately slow; pay
+    # for it once per session instead of once per admin test.
+    login = shared_client.post(
+        "/v1/auth/login",
+        json={"email": "admin@example.com", "password": "AdminPass123!"},
+    )
+    assert login.status_code == 200
+    return login.json()["accessToken"]
+
+@pytest.fixture
+def admin_headers(admin_token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {admin_token}"}
+
+@pytest.fixture(scope="module")
+def registered_shopper(shared_client: TestClient) -> tuple[str, str]:
+    # (session_id, access_token) for one customer shared by a module's tests;
+    # registration hashes the password, so do it once rather than per test.
+    session = shared_client.post("/v1/sessions", json={"channel": "web", "initialContext": {}})
+    assert session.status_code == 201
+    session_id = str(session.json()["sessionId"])
+    register = shared_client.post(
+        "/v1/auth/register",
+        headers={"X-Session-Id": session_id},
+        json={
+            "email": f"shopper-{uuid4().hex}@example.com",
+            "password": "SecurePass123!",
+            "name": "Shared Shopper",
+        },
+    )
+    assert register.status_code == 201
+    return session_id, str(register.json()["accessToken"])
+
+_FAST_HASH_PREFIX = "test-sha256$"
+
+def _fast_hash_password(password: str) -> str:
+    return _FAST_HASH_PREFIX + hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+def _fast_verify_password(password: str, password_hash: str) -> bool:
+    if password_hash.startswith(_FAST_HASH_PREFIX):
+        return password_hash == _fast_hash_password(password)
+    # The seeded admin still carries a real PBKDF2 hash.
+    return verify_password(password, password_hash)
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # PBKDF2 at production cost dominates every register/login in the suite;
+    # set FAST_HASH_IN_TESTS=0 to exercise the real hasher end to end. Session
+    # scope puts the patch in place before session and module fixtures such as
+    # registered_shopper register their users.
+    if os.environ.get("FAST_HASH_IN_TESTS", "1") == "0":
+        yield
+        return
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(auth_service, "hash_password", _fast_hash_password)
+        patch.setattr(auth_service, "verify_password", _fast_verify_password)
+        yield
+
+@pytest.fixture(autouse=True)
+def no_llm_planner(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep a developer's LLM_ENABLED/OPENROUTER_API_KEY from turning every chat
+    # request into a network round trip; planner tests install their own fake.
+    if "planner" in request.node.name:
+        return
+    monkeypatch.setattr(llm_client, "plan_actions", lambda **_: None)
+
 @pytest.fixture(autouse=True)
 def reset_db_state():
     # If necessary, we can clean up between tests here, but for now integration tests 
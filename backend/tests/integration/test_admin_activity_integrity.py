@@ -3,22 +3,12 @@ from __future__ import annotations
 from fastapi.testclient import TestClient
 
 from app.container import store
-from app.main import app
 
 
-def _admin_headers(client: TestClient) -> dict[str, str]:
-    login = client.post(
-        "/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass123!"},
-    )
-    assert login.status_code == 200
-    token = login.json()["accessToken"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_admin_activity_integrity_endpoint_detects_tampering() -> None:
-    client = TestClient(app)
-    headers = _admin_headers(client)
+def test_admin_activity_integrity_endpoint_detects_tampering(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
+    headers = admin_headers
 
     update = client.put(
         "/v1/admin/voice/settings",
@@ -1,20 +1,8 @@
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-
-def _admin_headers(client: TestClient) -> dict[str, str]:
-    login = client.post(
-        "/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass123!"},
-    )
-    assert login.status_code == 200
-    return {"Authorization": f"Bearer {login.json()['accessToken']}"}
-
-
-def test_admin_category_crud_and_activity_logging() -> None:
-    client = TestClient(app)
-    headers = _admin_headers(client)
+def test_admin_category_crud_and_activity_logging(client: TestClient, admin_headers: dict[str, str]) -> None:
+    headers = admin_headers
 
     create = client.post(
         "/v1/admin/categories",
@@ -54,8 +42,9 @@ def test_admin_category_crud_and_activity_logging() -> None:
     assert "category_delete" in actions
 
 
-def test_support_ticket_lifecycle_via_chat_and_admin() -> None:
-    client = TestClient(app)
+def test_support_ticket_lifecycle_via_chat_and_admin(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
     session = client.post("/v1/sessions", json={"channel": "web", "initialContext": {}})
     assert session.status_code == 201
     session_id = session.json()["sessionId"]
@@ -83,7 +72,7 @@ def test_support_ticket_lifecycle_via_chat_and_admin() -> None:
 
     admin_update = client.patch(
         f"/v1/admin/support/tickets/{ticket_id}",
-        headers=_admin_headers(client),
+        headers=admin_headers,
         json={"status": "in_progress", "note": "Assigned to specialist"},
     )
     assert admin_update.status_code == 200
@@ -101,9 +90,7 @@ def test_support_ticket_lifecycle_via_chat_and_admin() -> None:
     assert close_ticket.json()["payload"]["data"]["ticket"]["status"] == "resolved"
 
 
-def test_product_brand_filter_and_brand_search() -> None:
-    client = TestClient(app)
-
+def test_product_brand_filter_and_brand_search(client: TestClient) -> None:
     by_brand = client.get("/v1/products?brand=AeroThread")
     assert by_brand.status_code == 200
     products = by_brand.json()["products"]
@@ -1,21 +1,10 @@
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-
-def _admin_headers(client: TestClient) -> dict[str, str]:
-    admin_login = client.post(
-        "/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass123!"},
-    )
-    assert admin_login.status_code == 200
-    token = admin_login.json()["accessToken"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_admin_can_update_inventory_and_product_stock_flag() -> None:
-    client = TestClient(app)
-    headers = _admin_headers(client)
+def test_admin_can_update_inventory_and_product_stock_flag(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
+    headers = admin_headers
 
     current = client.get("/v1/admin/inventory/var_001", headers=headers)
     assert current.status_code == 200
@@ -43,9 +32,9 @@ def test_admin_can_update_inventory_and_product_stock_flag() -> None:
     assert restore.json()["inventory"]["availableQuantity"] == 5
 
 
-def test_support_escalation_creates_ticket_and_stats_reflect_it() -> None:
-    client = TestClient(app)
-
+def test_support_escalation_creates_ticket_and_stats_reflect_it(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
     session = client.post("/v1/sessions", json={"channel": "web", "initialContext": {}})
     assert session.status_code == 201
     session_id = session.json()["sessionId"]
@@ -63,6 +52,6 @@ def test_support_escalation_creates_ticket_and_stats_reflect_it() -> None:
     assert payload["agent"] == "support"
     assert payload["data"]["ticket"]["status"] == "open"
 
-    admin_stats = client.get("/v1/admin/stats", headers=_admin_headers(client))
+    admin_stats = client.get("/v1/admin/stats", headers=admin_headers)
     assert admin_stats.status_code == 200
     assert admin_stats.json()["supportOpenTickets"] >= 1
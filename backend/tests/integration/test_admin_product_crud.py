@@ -1,18 +1,8 @@
 from fastapi.testclient import TestClient
 
-from app.main import app
 
-
-def test_admin_can_manage_products() -> None:
-    client = TestClient(app)
-
-    admin_login = client.post(
-        "/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass123!"},
-    )
-    assert admin_login.status_code == 200
-    admin_token = admin_login.json()["accessToken"]
-    headers = {"Authorization": f"Bearer {admin_token}"}
+def test_admin_can_manage_products(client: TestClient, admin_headers: dict[str, str]) -> None:
+    headers = admin_headers
 
     create = client.post(
         "/v1/admin/products",
@@ -1,11 +1,7 @@
 from fastapi.testclient import TestClient
 
-from app.main import app
-
-
-def test_admin_stats_requires_admin_role() -> None:
-    client = TestClient(app)
 
+def test_admin_stats_requires_admin_role(client: TestClient) -> None:
     customer = client.post(
         "/v1/auth/register",
         json={
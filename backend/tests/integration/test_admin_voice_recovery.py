@@ -7,7 +7,6 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.container import store, voice_recovery_service
-from app.main import app
 
 
 class _FakeSuperUClient:
@@ -23,20 +22,9 @@ class _FakeSuperUClient:
         return []
 
 
-def _admin_headers(client: TestClient) -> dict[str, str]:
-    admin_login = client.post(
-        "/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass123!"},
-    )
-    assert admin_login.status_code == 200
-    token = admin_login.json()["accessToken"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_admin_voice_recovery_endpoints_and_processing(monkeypatch: pytest.MonkeyPatch) -> None:
-    client = TestClient(app)
-    admin_headers = _admin_headers(client)
-
+def test_admin_voice_recovery_endpoints_and_processing(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, admin_headers: dict[str, str]
+) -> None:
     customer = client.post(
         "/v1/auth/register",
         json={
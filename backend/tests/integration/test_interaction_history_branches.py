@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from uuid import uuid4
+from itertools import count
 
 import pytest
 from fastapi.testclient import TestClient
 
 import app.api.routes.interaction_routes as interaction_routes
-from app.main import app
+
+_EMAIL_SEQ = count()
 
 
 def _create_session(client: TestClient) -> str:
@@ -20,7 +21,7 @@ def _register_user(client: TestClient, *, session_id: str) -> str:
         "/v1/auth/register",
         headers={"X-Session-Id": session_id},
         json={
-            "email": f"history-{uuid4().hex}@example.com",
+            "email": f"history-{next(_EMAIL_SEQ)}@example.com",
             "password": "SecurePass123!",
             "name": "History User",
         },
@@ -30,9 +31,9 @@ def _register_user(client: TestClient, *, session_id: str) -> str:
 
 
 def test_authenticated_history_builds_fallback_from_memory_when_session_history_is_empty(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
     session_id = _create_session(client)
     token = _register_user(client, session_id=session_id)
 
@@ -83,8 +84,7 @@ def test_authenticated_history_builds_fallback_from_memory_when_session_history_
     assert payload["messages"][0]["response"]["agent"] == "memory"
 
 
-def test_guest_history_requires_session_id() -> None:
-    client = TestClient(app)
+def test_guest_history_requires_session_id(client: TestClient) -> None:
     response = client.get("/v1/interactions/history")
     assert response.status_code == 400
     error = response.json()["error"]
@@ -92,9 +92,9 @@ def test_guest_history_requires_session_id() -> None:
 
 
 def test_process_message_creates_session_when_missing_and_handles_identity_link_failure(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
     seed_session_id = _create_session(client)
     token = _register_user(client, session_id=seed_session_id)
 
@@ -1,6 +1,54 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+from uuid import uuid4
+
+import orjson
+import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.container import llm_client, orchestrator
+from app.core.config import Settings
+from app.infrastructure.llm_client import LLMActionPlan, LLMPlannedAction
+
+# Planner fakes hand back these prebuilt plans; each test sends one planned
+# message, so no plan is executed twice.
+_SHOES_AND_HOODIE_PLAN = LLMActionPlan(
+    actions=[
+        LLMPlannedAction(
+            name="add_item",
+            target_agent="cart",
+            params={"query": "running shoes", "quantity": 2},
+        ),
+        LLMPlannedAction(
+            name="add_item",
+            target_agent="cart",
+            params={"query": "hoodie", "quantity": 1},
+        ),
+    ],
+    confidence=0.92,
+    needs_clarification=False,
+    clarification_question="",
+)
+
+_MISSING_THEN_SHOES_PLAN = LLMActionPlan(
+    actions=[
+        LLMPlannedAction(
+            name="add_item",
+            target_agent="cart",
+            params={"query": "item-does-not-exist", "quantity": 1},
+        ),
+        LLMPlannedAction(
+            name="add_item",
+            target_agent="cart",
+            params={"query": "running shoes", "quantity": 1},
+        ),
+    ],
+    confidence=0.95,
+    needs_clarification=False,
+    clarification_question="",
+)
 
 
 def _create_session(client: TestClient) -> str:
@@ -9,57 +57,97 @@ def _create_session(client: TestClient) -> str:
     return response.json()["sessionId"]
 
 
-def test_interaction_search_and_add_to_cart_guest() -> None:
-    client = TestClient(app)
-    session_id = _create_session(client)
-
-    search = client.post(
+def _send_message(
+    client: TestClient,
+    session_id: str,
+    content: str,
+    *,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    response = client.post(
         "/v1/interactions/message",
+        headers=headers,
+        json={"sessionId": session_id, "content": content, "channel": "web"},
+    )
+    assert response.status_code == 200
+    # orjson decodes the agent payloads (product lists included) in C.
+    return orjson.loads(response.content)["payload"]
+
+
+@pytest.fixture(scope="module")
+def placed_order(shared_client: TestClient, registered_shopper: tuple[str, str]) -> tuple[str, str, dict[str, Any]]:
+    # (session_id, access_token, order) for the module's shared shopper. The
+    # order is seeded through the plain REST routes, since agent routing is not
+    # what the order-centric tests exercise, and none of them need a fresh one.
+    session_id, token = registered_shopper
+    auth_header = {"Authorization": f"Bearer {token}", "X-Session-Id": session_id}
+    add_item = shared_client.post(
+        "/v1/cart/items",
+        headers=auth_header,
+        json={"productId": "prod_001", "variantId": "var_001", "quantity": 1},
+    )
+    assert add_item.status_code == 201
+
+    order = shared_client.post(
+        "/v1/orders",
+        headers={**auth_header, "Idempotency-Key": f"placed-order-{uuid4().hex}"},
         json={
-            "sessionId": session_id,
-            "content": "Show me running shoes under $150",
-            "channel": "web",
+            "shippingAddress": {
+                "name": "Shared Shopper",
+                "line1": "100 Market St",
+                "city": "Austin",
+                "state": "TX",
+                "postalCode": "78701",
+                "country": "US",
+            },
+            "paymentMethod": {"type": "card", "token": "pm_test"},
         },
     )
-    assert search.status_code == 200
-    payload = search.json()["payload"]
+    assert order.status_code == 201
+    return session_id, token, order.json()["order"]
+
+
+@pytest.fixture
+def planner_settings(monkeypatch: pytest.MonkeyPatch) -> Callable[..., Settings]:
+    def apply(**overrides: Any) -> Settings:
+        settings = replace(
+            llm_client.settings,
+            llm_enabled=True,
+            openrouter_api_key="test-key",
+            llm_planner_enabled=True,
+            planner_feature_enabled=True,
+            **overrides,
+        )
+        monkeypatch.setattr(llm_client, "settings", settings)
+        return settings
+
+    return apply
+
+
+def test_interaction_search_and_add_to_cart_guest(client: TestClient) -> None:
+    session_id = _create_session(client)
+
+    payload = _send_message(client, session_id, "Show me running shoes under $150")
     assert payload["agent"] == "product"
     assert len(payload["data"]["products"]) >= 1
 
-    add = client.post(
-        "/v1/interactions/message",
-        json={"sessionId": session_id, "content": "add to cart", "channel": "web"},
-    )
-    assert add.status_code == 200
-    assert add.json()["payload"]["agent"] == "cart"
+    add = _send_message(client, session_id, "add to cart")
+    assert add["agent"] == "cart"
 
     cart = client.get("/v1/cart", headers={"X-Session-Id": session_id})
     assert cart.status_code == 200
     assert cart.json()["itemCount"] >= 1
 
 
-def test_interaction_checkout_requires_auth_then_succeeds() -> None:
-    client = TestClient(app)
+def test_interaction_checkout_requires_auth_then_succeeds(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    search = client.post(
-        "/v1/interactions/message",
-        json={"sessionId": session_id, "content": "show me running shoes", "channel": "web"},
-    )
-    assert search.status_code == 200
+    _send_message(client, session_id, "show me running shoes")
 
-    add = client.post(
-        "/v1/interactions/message",
-        json={"sessionId": session_id, "content": "add to cart", "channel": "web"},
-    )
-    assert add.status_code == 200
+    _send_message(client, session_id, "add to cart")
 
-    guest_checkout = client.post(
-        "/v1/interactions/message",
-        json={"sessionId": session_id, "content": "checkout", "channel": "web"},
-    )
-    assert guest_checkout.status_code == 200
-    assert guest_checkout.json()["payload"]["data"]["code"] == "AUTH_REQUIRED"
+    guest_checkout = _send_message(client, session_id, "checkout")
+    assert guest_checkout["data"]["code"] == "AUTH_REQUIRED"
 
     auth = client.post(
         "/v1/auth/register",
@@ -73,80 +161,32 @@ def test_interaction_checkout_requires_auth_then_succeeds() -> None:
     assert auth.status_code == 201
     token = auth.json()["accessToken"]
 
-    user_checkout = client.post(
-        "/v1/interactions/message",
+    payload = _send_message(
+        client,
+        session_id,
+        "checkout",
         headers={"Authorization": f"Bearer {token}"},
-        json={"sessionId": session_id, "content": "checkout", "channel": "web"},
     )
-    assert user_checkout.status_code == 200
-    payload = user_checkout.json()["payload"]
     assert payload["agent"] == "order"
     assert payload["data"]["order"]["status"] == "confirmed"
 
 
-def test_interaction_parallel_multi_status() -> None:
-    client = TestClient(app)
-    session_id = _create_session(client)
-
-    auth = client.post(
-        "/v1/auth/register",
-        headers={"X-Session-Id": session_id},
-        json={
-            "email": "parallel-status@example.com",
-            "password": "SecurePass123!",
-            "name": "Parallel User",
-        },
-    )
-    assert auth.status_code == 201
-    token = auth.json()["accessToken"]
+def test_interaction_parallel_multi_status(
+    client: TestClient, placed_order: tuple[str, str, dict[str, Any]]
+) -> None:
+    session_id, token, _ = placed_order
     auth_header = {"Authorization": f"Bearer {token}"}
 
-    client.post(
-        "/v1/interactions/message",
-        headers=auth_header,
-        json={"sessionId": session_id, "content": "show me running shoes", "channel": "web"},
-    )
-    client.post(
-        "/v1/interactions/message",
-        headers=auth_header,
-        json={"sessionId": session_id, "content": "add to cart", "channel": "web"},
-    )
-    client.post(
-        "/v1/interactions/message",
-        headers=auth_header,
-        json={"sessionId": session_id, "content": "checkout", "channel": "web"},
-    )
-
-    combined = client.post(
-        "/v1/interactions/message",
-        headers=auth_header,
-        json={
-            "sessionId": session_id,
-            "content": "show my cart and order status",
-            "channel": "web",
-        },
-    )
-    assert combined.status_code == 200
-    payload = combined.json()["payload"]
+    payload = _send_message(client, session_id, "show my cart and order status", headers=auth_header)
     assert payload["agent"] == "orchestrator"
     assert "cart" in payload["data"]
     assert "order" in payload["data"]
 
 
-def test_interaction_single_message_search_and_add_to_cart() -> None:
-    client = TestClient(app)
+def test_interaction_single_message_search_and_add_to_cart(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "find running shoes under $150 and add to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "find running shoes under $150 and add to cart")
     assert payload["agent"] == "orchestrator"
     assert "product" in payload["data"]
     assert "cart" in payload["data"]
@@ -156,30 +196,12 @@ def test_interaction_single_message_search_and_add_to_cart() -> None:
     assert cart.json()["itemCount"] >= 1
 
 
-def test_interaction_apply_discount_code() -> None:
-    client = TestClient(app)
+def test_interaction_apply_discount_code(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    seed = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "find running shoes and add to cart",
-            "channel": "web",
-        },
-    )
-    assert seed.status_code == 200
+    _send_message(client, session_id, "find running shoes and add to cart")
 
-    discount = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "apply discount code SAVE20",
-            "channel": "web",
-        },
-    )
-    assert discount.status_code == 200
-    payload = discount.json()["payload"]
+    payload = _send_message(client, session_id, "apply discount code SAVE20")
     assert payload["agent"] == "cart"
     assert "saved" in payload["message"].lower()
 
@@ -188,130 +210,44 @@ def test_interaction_apply_discount_code() -> None:
     assert float(cart.json()["discount"]) > 0.0
 
 
-def test_interaction_order_issue_phrase_routes_to_order_agent() -> None:
-    client = TestClient(app)
-    session_id = _create_session(client)
-    auth = client.post(
-        "/v1/auth/register",
-        headers={"X-Session-Id": session_id},
-        json={
-            "email": "order-issue@example.com",
-            "password": "SecurePass123!",
-            "name": "Order Issue User",
-        },
-    )
-    assert auth.status_code == 201
-    token = auth.json()["accessToken"]
-    auth_header = {"Authorization": f"Bearer {token}", "X-Session-Id": session_id}
-
-    add_item = client.post(
-        "/v1/cart/items",
-        headers=auth_header,
-        json={"productId": "prod_001", "variantId": "var_001", "quantity": 1},
-    )
-    assert add_item.status_code == 201
-
-    order = client.post(
-        "/v1/orders",
-        headers={**auth_header, "Idempotency-Key": "order-issue-key-1"},
-        json={
-            "shippingAddress": {
-                "name": "Issue User",
-                "line1": "100 Market St",
-                "city": "Austin",
-                "state": "TX",
-                "postalCode": "78701",
-                "country": "US",
-            },
-            "paymentMethod": {"type": "card", "token": "pm_issue"},
-        },
-    )
-    assert order.status_code == 201
+def test_interaction_order_issue_phrase_routes_to_order_agent(
+    client: TestClient, placed_order: tuple[str, str, dict[str, Any]]
+) -> None:
+    session_id, token, _ = placed_order
 
-    issue = client.post(
-        "/v1/interactions/message",
+    payload = _send_message(
+        client,
+        session_id,
+        "my order hasn't arrived yet",
         headers={"Authorization": f"Bearer {token}"},
-        json={"sessionId": session_id, "content": "my order hasn't arrived yet", "channel": "web"},
     )
-    assert issue.status_code == 200
-    payload = issue.json()["payload"]
     assert payload["agent"] == "order"
     assert "latest order" in payload["message"].lower()
 
 
-def test_interaction_change_order_address_when_allowed() -> None:
-    client = TestClient(app)
-    session_id = _create_session(client)
-    auth = client.post(
-        "/v1/auth/register",
-        headers={"X-Session-Id": session_id},
-        json={
-            "email": "address-change@example.com",
-            "password": "SecurePass123!",
-            "name": "Address User",
-        },
-    )
-    assert auth.status_code == 201
-    token = auth.json()["accessToken"]
-    auth_header = {"Authorization": f"Bearer {token}", "X-Session-Id": session_id}
-
-    add_item = client.post(
-        "/v1/cart/items",
-        headers=auth_header,
-        json={"productId": "prod_001", "variantId": "var_001", "quantity": 1},
-    )
-    assert add_item.status_code == 201
-
-    order = client.post(
-        "/v1/orders",
-        headers={**auth_header, "Idempotency-Key": "address-change-key-1"},
-        json={
-            "shippingAddress": {
-                "name": "Address User",
-                "line1": "100 Market St",
-                "city": "Austin",
-                "state": "TX",
-                "postalCode": "78701",
-                "country": "US",
-            },
-            "paymentMethod": {"type": "card", "token": "pm_address"},
-        },
-    )
-    assert order.status_code == 201
-    order_id = order.json()["order"]["id"]
+def test_interaction_change_order_address_when_allowed(
+    client: TestClient, placed_order: tuple[str, str, dict[str, Any]]
+) -> None:
+    session_id, token, order = placed_order
+    order_id = order["id"]
 
-    update = client.post(
-        "/v1/interactions/message",
+    payload = _send_message(
+        client,
+        session_id,
+        (
+            f"change order {order_id} address "
+            "line1=500 Main St, city=Austin, state=TX, postalCode=78702, country=US"
+        ),
         headers={"Authorization": f"Bearer {token}"},
-        json={
-            "sessionId": session_id,
-            "content": (
-                f"change order {order_id} address "
-                "line1=500 Main St, city=Austin, state=TX, postalCode=78702, country=US"
-            ),
-            "channel": "web",
-        },
     )
-    assert update.status_code == 200
-    payload = update.json()["payload"]
     assert payload["agent"] == "order"
     assert payload["data"]["shippingAddress"]["line1"] == "500 Main St"
 
 
-def test_interaction_add_by_product_name_and_quantity() -> None:
-    client = TestClient(app)
+def test_interaction_add_by_product_name_and_quantity(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add 2 running shoes to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add 2 running shoes to cart")
     assert payload["agent"] == "cart"
     assert "running shoes" in payload["message"].lower()
 
@@ -320,76 +256,36 @@ def test_interaction_add_by_product_name_and_quantity() -> None:
     assert cart.json()["itemCount"] == 2
 
 
-def test_interaction_add_to_cart_requests_clarification_when_ambiguous() -> None:
-    client = TestClient(app)
+def test_interaction_add_to_cart_requests_clarification_when_ambiguous(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add shoes to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add shoes to cart")
     assert payload["agent"] == "cart"
     assert payload["data"]["code"] == "CLARIFICATION_REQUIRED"
     assert "multiple matches" in payload["message"].lower()
     assert len(payload["data"]["options"]) >= 2
 
 
-def test_interaction_add_by_product_id_requires_variant_clarification() -> None:
-    client = TestClient(app)
+def test_interaction_add_by_product_id_requires_variant_clarification(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add prod_001 to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add prod_001 to cart")
     assert payload["agent"] == "cart"
     assert payload["data"]["code"] == "CLARIFICATION_REQUIRED"
     assert "size" in payload["message"].lower() or "color" in payload["message"].lower()
 
 
-def test_interaction_add_by_product_id_with_size_and_color_succeeds() -> None:
-    client = TestClient(app)
+def test_interaction_add_by_product_id_with_size_and_color_succeeds(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add prod_001 size 10 color blue to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add prod_001 size 10 color blue to cart")
     assert payload["agent"] == "cart"
     assert "added" in payload["message"].lower()
 
-def test_interaction_add_multiple_items_in_single_message() -> None:
-    client = TestClient(app)
+def test_interaction_add_multiple_items_in_single_message(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add 2 running shoes and 1 hoodie to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add 2 running shoes and 1 hoodie to cart")
     assert payload["agent"] == "cart"
     assert "added" in payload["message"].lower()
 
@@ -400,75 +296,33 @@ def test_interaction_add_multiple_items_in_single_message() -> None:
     assert any("hoodie" in name for name in names)
 
 
-def test_interaction_adjust_item_quantity_up_and_down() -> None:
-    client = TestClient(app)
+def test_interaction_adjust_item_quantity_up_and_down(client: TestClient) -> None:
     session_id = _create_session(client)
+    session_header = {"X-Session-Id": session_id}
 
-    seed = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add 2 running shoes to cart",
-            "channel": "web",
-        },
-    )
-    assert seed.status_code == 200
+    _send_message(client, session_id, "add 2 running shoes to cart")
 
-    increase = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "increase quantity of running shoes in cart by 2",
-            "channel": "web",
-        },
-    )
-    assert increase.status_code == 200
-    assert "updated" in increase.json()["payload"]["message"].lower()
+    increase = _send_message(client, session_id, "increase quantity of running shoes in cart by 2")
+    assert "updated" in increase["message"].lower()
 
-    cart_after_increase = client.get("/v1/cart", headers={"X-Session-Id": session_id})
+    cart_after_increase = client.get("/v1/cart", headers=session_header)
     assert cart_after_increase.status_code == 200
     first_item = cart_after_increase.json()["items"][0]
     assert first_item["quantity"] == 4
 
-    decrease = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "decrease quantity of running shoes in cart by 1",
-            "channel": "web",
-        },
-    )
-    assert decrease.status_code == 200
+    _send_message(client, session_id, "decrease quantity of running shoes in cart by 1")
 
-    cart_after_decrease = client.get("/v1/cart", headers={"X-Session-Id": session_id})
+    cart_after_decrease = client.get("/v1/cart", headers=session_header)
     assert cart_after_decrease.status_code == 200
     assert cart_after_decrease.json()["items"][0]["quantity"] == 3
 
 
-def test_interaction_clear_cart() -> None:
-    client = TestClient(app)
+def test_interaction_clear_cart(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    seed = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add 2 running shoes and 1 hoodie to cart",
-            "channel": "web",
-        },
-    )
-    assert seed.status_code == 200
+    _send_message(client, session_id, "add 2 running shoes and 1 hoodie to cart")
 
-    clear = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "empty my cart",
-            "channel": "web",
-        },
-    )
-    assert clear.status_code == 200
-    payload = clear.json()["payload"]
+    payload = _send_message(client, session_id, "empty my cart")
     assert payload["agent"] == "cart"
     assert "cleared" in payload["message"].lower()
 
@@ -477,77 +331,28 @@ def test_interaction_clear_cart() -> None:
     assert cart.json()["itemCount"] == 0
 
 
-def test_interaction_remove_partial_quantity_from_cart() -> None:
-    client = TestClient(app)
+def test_interaction_remove_partial_quantity_from_cart(client: TestClient) -> None:
     session_id = _create_session(client)
 
-    seed = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add 3 running shoes to cart",
-            "channel": "web",
-        },
-    )
-    assert seed.status_code == 200
+    _send_message(client, session_id, "add 3 running shoes to cart")
 
-    remove = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "remove 2 running shoes from cart",
-            "channel": "web",
-        },
-    )
-    assert remove.status_code == 200
-    assert "remaining quantity is 1" in remove.json()["payload"]["message"].lower()
+    remove = _send_message(client, session_id, "remove 2 running shoes from cart")
+    assert "remaining quantity is 1" in remove["message"].lower()
 
     cart = client.get("/v1/cart", headers={"X-Session-Id": session_id})
     assert cart.status_code == 200
     assert cart.json()["items"][0]["quantity"] == 1
 
 
-def test_interaction_llm_planner_executes_multi_step_cart_actions(monkeypatch) -> None:
-    from app.container import llm_client
-    from app.infrastructure.llm_client import LLMActionPlan, LLMPlannedAction
-
-    client = TestClient(app)
+def test_interaction_llm_planner_executes_multi_step_cart_actions(client: TestClient, monkeypatch) -> None:
     session_id = _create_session(client)
 
     def fake_plan_actions(*, message: str, recent_messages: list[dict[str, object]] | None = None, inferred_intent: str | None = None) -> LLMActionPlan | None:
-        lowered = message.lower()
-        if "running shoes" not in lowered:
-            return None
-        return LLMActionPlan(
-            actions=[
-                LLMPlannedAction(
-                    name="add_item",
-                    target_agent="cart",
-                    params={"query": "running shoes", "quantity": 2},
-                ),
-                LLMPlannedAction(
-                    name="add_item",
-                    target_agent="cart",
-                    params={"query": "hoodie", "quantity": 1},
-                ),
-            ],
-            confidence=0.92,
-            needs_clarification=False,
-            clarification_question="",
-        )
+        return _SHOES_AND_HOODIE_PLAN if "running shoes" in message.lower() else None
 
     monkeypatch.setattr(llm_client, "plan_actions", fake_plan_actions)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add running shoes and hoodie to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add running shoes and hoodie to cart")
     assert payload["agent"] == "orchestrator"
     assert payload["metadata"]["planner"]["used"] is True
     assert payload["metadata"]["planner"]["actionCount"] == 2
@@ -560,57 +365,18 @@ def test_interaction_llm_planner_executes_multi_step_cart_actions(monkeypatch) -
     assert cart.json()["itemCount"] == 3
 
 
-def test_interaction_planner_atomic_mode_reports_step_errors(monkeypatch) -> None:
-    from dataclasses import replace
-
-    from app.container import llm_client
-    from app.infrastructure.llm_client import LLMActionPlan, LLMPlannedAction
-
-    client = TestClient(app)
+def test_interaction_planner_atomic_mode_reports_step_errors(
+    client: TestClient, monkeypatch, planner_settings: Callable[..., Settings]
+) -> None:
     session_id = _create_session(client)
-
-    planner_settings = replace(
-        llm_client.settings,
-        llm_enabled=True,
-        openrouter_api_key="test-key",
-        llm_planner_enabled=True,
-        planner_feature_enabled=True,
-        planner_canary_percent=100,
-        llm_planner_execution_mode="atomic",
-    )
-    monkeypatch.setattr(llm_client, "settings", planner_settings)
+    planner_settings(planner_canary_percent=100, llm_planner_execution_mode="atomic")
 
     def fake_plan_actions(*, message: str, recent_messages: list[dict[str, object]] | None = None, inferred_intent: str | None = None) -> LLMActionPlan | None:
-        return LLMActionPlan(
-            actions=[
-                LLMPlannedAction(
-                    name="add_item",
-                    target_agent="cart",
-                    params={"query": "item-does-not-exist", "quantity": 1},
-                ),
-                LLMPlannedAction(
-                    name="add_item",
-                    target_agent="cart",
-                    params={"query": "running shoes", "quantity": 1},
-                ),
-            ],
-            confidence=0.95,
-            needs_clarification=False,
-            clarification_question="",
-        )
+        return _MISSING_THEN_SHOES_PLAN
 
     monkeypatch.setattr(llm_client, "plan_actions", fake_plan_actions)
 
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add items to cart",
-            "channel": "web",
-        },
-    )
-    assert response.status_code == 200
-    payload = response.json()["payload"]
+    payload = _send_message(client, session_id, "add items to cart")
     planner = payload["metadata"]["planner"]
     assert planner["executionMode"] == "atomic"
     assert planner["stepCount"] == 2
@@ -619,33 +385,22 @@ def test_interaction_planner_atomic_mode_reports_step_errors(monkeypatch) -> Non
     assert planner["steps"][1]["error"]["code"] == "SKIPPED_ATOMIC_MODE"
 
 
-def test_interaction_planner_canary_zero_disables_planner_attempt(monkeypatch) -> None:
-    from dataclasses import replace
-
-    from app.container import llm_client
-
-    client = TestClient(app)
+def test_interaction_planner_canary_zero_disables_planner_attempt(
+    client: TestClient, planner_settings: Callable[..., Settings]
+) -> None:
     session_id = _create_session(client)
-
-    planner_settings = replace(
-        llm_client.settings,
-        llm_enabled=True,
-        openrouter_api_key="test-key",
-        llm_planner_enabled=True,
-        planner_feature_enabled=True,
-        planner_canary_percent=0,
-    )
-    monkeypatch.setattr(llm_client, "settings", planner_settings)
-
-    response = client.post(
-        "/v1/interactions/message",
-        json={
-            "sessionId": session_id,
-            "content": "add running shoes and hoodie to cart",
-            "channel": "web",
-        },
+    planner_settings(planner_canary_percent=0)
+
+    # Only the execution-policy flags are under test; the HTTP wiring of the
+    # planner is covered by the other planner tests above.
+    payload = asyncio.run(
+        orchestrator.process_message(
+            message="add running shoes and hoodie to cart",
+            session_id=session_id,
+            user_id=None,
+            channel="web",
+        )
     )
-    assert response.status_code == 200
-    execution_policy = response.json()["payload"]["metadata"]["executionPolicy"]
+    execution_policy = payload["metadata"]["executionPolicy"]
     assert execution_policy["plannerEnabled"] is False
     assert execution_policy["plannerAttempted"] is False
@@ -2,8 +2,6 @@ from uuid import uuid4
 
 from fastapi.testclient import TestClient
 
-from app.main import app
-
 
 def _create_session(client: TestClient, channel: str = "web") -> str:
     response = client.post("/v1/sessions", json={"channel": channel, "initialContext": {}})
@@ -11,8 +9,7 @@ def _create_session(client: TestClient, channel: str = "web") -> str:
     return response.json()["sessionId"]
 
 
-def test_login_reuses_existing_user_session_for_chat_continuity() -> None:
-    client = TestClient(app)
+def test_login_reuses_existing_user_session_for_chat_continuity(client: TestClient) -> None:
     session_a = _create_session(client, channel="web")
     email = f"continuity-{uuid4().hex}@example.com"
     password = "SecurePass123!"
@@ -60,8 +57,7 @@ def test_login_reuses_existing_user_session_for_chat_continuity() -> None:
     assert add.json()["payload"]["agent"] == "cart"
 
 
-def test_websocket_switches_to_existing_user_session_when_authenticated() -> None:
-    client = TestClient(app)
+def test_websocket_switches_to_existing_user_session_when_authenticated(client: TestClient) -> None:
     session_a = _create_session(client, channel="web")
     email = f"ws-continuity-{uuid4().hex}@example.com"
     password = "SecurePass123!"
@@ -4,14 +4,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 import app.api.routes.voice_webhook_routes as voice_webhook_routes
-from app.main import app
 
 
 def test_voice_callback_rejects_when_signature_verification_fails(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     def _verify_fail(**_: object) -> None:
         raise ValueError("bad signature")
 
@@ -33,10 +31,9 @@ def test_voice_callback_rejects_when_signature_verification_fails(
 
 
 def test_voice_callback_rejects_empty_payload_after_signature_check(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     monkeypatch.setattr(
         voice_webhook_routes.superu_client,
         "verify_webhook_signature",
@@ -59,10 +56,9 @@ def test_voice_callback_rejects_empty_payload_after_signature_check(
 
 
 def test_voice_callback_rejects_invalid_json_payload(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     monkeypatch.setattr(
         voice_webhook_routes.superu_client,
         "verify_webhook_signature",
@@ -85,10 +81,9 @@ def test_voice_callback_rejects_invalid_json_payload(
 
 
 def test_voice_callback_rejects_non_object_json_payload(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     monkeypatch.setattr(
         voice_webhook_routes.superu_client,
         "verify_webhook_signature",
@@ -111,10 +106,9 @@ def test_voice_callback_rejects_non_object_json_payload(
 
 
 def test_voice_callback_rejects_when_ingest_returns_not_accepted(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     monkeypatch.setattr(
         voice_webhook_routes.superu_client,
         "verify_webhook_signature",
@@ -142,10 +136,9 @@ def test_voice_callback_rejects_when_ingest_returns_not_accepted(
 
 
 def test_voice_callback_returns_success_when_ingest_accepts(
+    client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    client = TestClient(app)
-
     monkeypatch.setattr(
         voice_webhook_routes.superu_client,
         "verify_webhook_signature",
@@ -1,8 +1,26 @@
+from typing import Any
+
+import orjson
 from fastapi.testclient import TestClient
+from starlette.testclient import WebSocketTestSession
 
 from app.main import app
 
 
+def _receive_event(websocket: WebSocketTestSession) -> dict[str, Any]:
+    return orjson.loads(websocket.receive_text())
+
+
+def _drain_until_response(websocket: WebSocketTestSession, limit: int = 20) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for _ in range(limit):
+        event = _receive_event(websocket)
+        events.append(event)
+        if event["type"] == "response":
+            break
+    return events
+
+
 def test_websocket_message_flow() -> None:
     client = TestClient(app)
     session = client.post("/v1/sessions", json={"channel": "websocket", "initialContext": {}})
@@ -16,13 +34,13 @@ def test_websocket_message_flow() -> None:
                 "payload": {"content": "show me running shoes", "timestamp": "2026-01-01T00:00:00Z"},
             }
         )
-        response = websocket.receive_json()
+        response = _receive_event(websocket)
         assert response["type"] == "response"
         assert response["payload"]["agent"] == "product"
         assert len(response["payload"]["data"]["products"]) >= 1
 
         websocket.send_json({"type": "typing", "payload": {"isTyping": True}})
-        typing = websocket.receive_json()
+        typing = _receive_event(websocket)
         assert typing["type"] == "typing"
         assert typing["payload"]["isTyping"] is True
 
@@ -50,8 +68,7 @@ def test_websocket_streaming_flow_when_requested() -> None:
         saw_end = False
         saw_response = False
 
-        for _ in range(20):
-            event = websocket.receive_json()
+        for event in _drain_until_response(websocket):
             event_type = event["type"]
             if event_type == "stream_start":
                 saw_start = True
@@ -64,7 +81,6 @@ def test_websocket_streaming_flow_when_requested() -> None:
             elif event_type == "response":
                 saw_response = True
                 assert event["payload"]["agent"] == "product"
-                break
 
         assert saw_start is True
         assert saw_delta is True
@@ -93,8 +109,7 @@ def test_websocket_assistant_typing_events_when_requested() -> None:
         saw_typing_start = False
         saw_typing_end = False
         saw_response = False
-        for _ in range(20):
-            event = websocket.receive_json()
+        for event in _drain_until_response(websocket):
             if event["type"] == "typing" and event.get("payload", {}).get("actor") == "assistant":
                 if event["payload"].get("isTyping") is True:
                     saw_typing_start = True
@@ -102,7 +117,6 @@ def test_websocket_assistant_typing_events_when_requested() -> None:
                     saw_typing_end = True
             if event["type"] == "response":
                 saw_response = True
-                break
 
         assert saw_typing_start is True
         assert saw_typing_end is True
@@ -117,7 +131,7 @@ def test_websocket_ping_pong_roundtrip() -> None:
 
     with client.websocket_connect(f"/ws?sessionId={session_id}") as websocket:
         websocket.send_json({"type": "ping", "payload": {"timestamp": "2026-01-01T00:00:00Z"}})
-        event = websocket.receive_json()
+        event = _receive_event(websocket)
         assert event["type"] == "pong"
 
 
@@ -135,7 +149,7 @@ def test_websocket_reconnect_same_session() -> None:
             }
         )
         while True:
-            first = websocket.receive_json()
+            first = _receive_event(websocket)
             if first["type"] == "response":
                 break
         assert first["payload"]["agent"] == "product"
@@ -148,7 +162,7 @@ def test_websocket_reconnect_same_session() -> None:
             }
         )
         while True:
-            second = websocket.receive_json()
+            second = _receive_event(websocket)
             if second["type"] == "response":
                 break
         assert second["payload"]["agent"] == "product"
@@ -159,7 +173,7 @@ def test_websocket_recovers_stale_session_and_keeps_cart_state() -> None:
     stale_session_id = "session_nonexistent_ws"
 
     with client.websocket_connect(f"/ws?sessionId={stale_session_id}") as websocket:
-        first = websocket.receive_json()
+        first = _receive_event(websocket)
         assert first["type"] == "session"
         repaired_session_id = first["payload"]["sessionId"]
         assert repaired_session_id != stale_session_id
@@ -171,7 +185,7 @@ def test_websocket_recovers_stale_session_and_keeps_cart_state() -> None:
             }
         )
         while True:
-            add_first = websocket.receive_json()
+            add_first = _receive_event(websocket)
             if add_first["type"] == "response":
                 break
         first_cart = add_first["payload"]["data"]["cart"]
@@ -185,7 +199,7 @@ def test_websocket_recovers_stale_session_and_keeps_cart_state() -> None:
             }
         )
         while True:
-            add_second = websocket.receive_json()
+            add_second = _receive_event(websocket)
             if add_second["type"] == "response":
                 break
         second_cart = add_second["payload"]["data"]["cart"]
@@ -200,7 +214,7 @@ def test_websocket_recovers_stale_session_and_keeps_cart_state() -> None:
             }
         )
         while True:
-            view = websocket.receive_json()
+            view = _receive_event(websocket)
             if view["type"] == "response":
                 break
         view_cart = view["payload"]["data"]["cart"]
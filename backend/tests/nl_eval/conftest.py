@@ -0,0 +1,16 @@
+import pytest
+
+from app.orchestrator.action_extractor import ActionExtractor
+from app.orchestrator.intent_classifier import IntentClassifier
+
+
+# Both are stateless rule engines (the classifier has no LLM client here), so
+# one instance can serve every evaluation case in the session.
+@pytest.fixture(scope="session")
+def classifier() -> IntentClassifier:
+    return IntentClassifier()
+
+
+@pytest.fixture(scope="session")
+def extractor() -> ActionExtractor:
+    return ActionExtractor()
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any
 
+import orjson
+
 from app.orchestrator.action_extractor import ActionExtractor
 from app.orchestrator.intent_classifier import IntentClassifier
 
 
-def _build_eval_cases() -> list[dict[str, Any]]:
-    cases: list[dict[str, Any]] = []
+# Cases only read these, so every case of a kind shares one tuple / dict.
+_ADD_ACTIONS = ("add_item",)
+_REMOVE_ACTIONS = ("remove_item",)
+_SEARCH_ACTIONS = ("search_products",)
+_DISCOUNT_ACTIONS = ("apply_discount",)
+_ORDER_STATUS_ACTIONS = ("get_order_status",)
+_CANCEL_ACTIONS = ("cancel_order",)
+_TICKET_STATUS_ACTIONS = ("ticket_status",)
+_CLOSE_TICKET_ACTIONS = ("close_ticket",)
+_PREFERENCE_ACTIONS = ("save_preference",)
+_PRICE_REFINEMENT_CONTEXT = {"recent": [{"intent": "product_search", "agent": "product"}]}
+_REPEATED_CASES = [
+    {
+        "message": "show my cart and order status",
+        "intent": "multi_status",
+        "actions": ("get_cart", "get_order_status"),
+    },
+    {"message": "show me cart", "intent": "view_cart", "actions": ("get_cart",)},
+    {"message": "please empty my cart", "intent": "clear_cart", "actions": ("clear_cart",)},
+    {"message": "checkout", "intent": "checkout", "actions": ("checkout_summary",)},
+]
 
+
+def _build_eval_cases() -> list[dict[str, Any]]:
     products = [
         "running shoes",
         "hoodie",
@@ -18,130 +42,66 @@ def _build_eval_cases() -> list[dict[str, Any]]:
         "water bottle",
     ]
     quantities = [1, 2, 3, 4, 5]
-
-    for quantity in quantities:
-        for product in products:
-            cases.append(
-                {
-                    "message": f"add {quantity} {product} to cart",
-                    "intent": "add_to_cart",
-                    "actions": ["add_item"],
-                }
-            )
-            cases.append(
-                {
-                    "message": f"remove {quantity} {product} from cart",
-                    "intent": "remove_from_cart",
-                    "actions": ["remove_item"],
-                }
-            )
-
-    for product in products:
-        cases.append(
-            {
-                "message": f"find {product} under 150",
-                "intent": "product_search",
-                "actions": ["search_products"],
-            }
-        )
-        cases.append(
-            {
-                "message": f"search {product} over 40",
-                "intent": "product_search",
-                "actions": ["search_products"],
-            }
+    order_ids = range(101, 136)
+    ticket_ids = range(301, 341)
+
+    cases: list[dict[str, Any]] = [
+        case
+        for quantity in quantities
+        for product in products
+        for case in (
+            {"message": f"add {quantity} {product} to cart", "intent": "add_to_cart", "actions": _ADD_ACTIONS},
+            {"message": f"remove {quantity} {product} from cart", "intent": "remove_from_cart", "actions": _REMOVE_ACTIONS},
         )
-
-    for code in ["SAVE10", "SAVE20", "SUMMER25", "WELCOME5", "VIP30"]:
-        cases.append(
-            {
-                "message": f"apply discount code {code}",
-                "intent": "apply_discount",
-                "actions": ["apply_discount"],
-            }
-        )
-
-    for order_idx in range(101, 136):
-        cases.append(
-            {
-                "message": f"where is my order order_{order_idx}",
-                "intent": "order_status",
-                "actions": ["get_order_status"],
-            }
-        )
-        cases.append(
-            {
-                "message": f"cancel order order_{order_idx}",
-                "intent": "cancel_order",
-                "actions": ["cancel_order"],
-            }
-        )
-
-    for ticket_idx in range(301, 341):
-        cases.append(
-            {
-                "message": f"ticket status ticket_{ticket_idx}",
-                "intent": "support_status",
-                "actions": ["ticket_status"],
-            }
+    ]
+    cases += [
+        case
+        for product in products
+        for case in (
+            {"message": f"find {product} under 150", "intent": "product_search", "actions": _SEARCH_ACTIONS},
+            {"message": f"search {product} over 40", "intent": "product_search", "actions": _SEARCH_ACTIONS},
         )
-        cases.append(
-            {
-                "message": f"close ticket ticket_{ticket_idx}",
-                "intent": "support_close",
-                "actions": ["close_ticket"],
-            }
+    ]
+    cases += [
+        {"message": f"apply discount code {code}", "intent": "apply_discount", "actions": _DISCOUNT_ACTIONS}
+        for code in ["SAVE10", "SAVE20", "SUMMER25", "WELCOME5", "VIP30"]
+    ]
+    cases += [
+        case
+        for order_idx in order_ids
+        for case in (
+            {"message": f"where is my order order_{order_idx}", "intent": "order_status", "actions": _ORDER_STATUS_ACTIONS},
+            {"message": f"cancel order order_{order_idx}", "intent": "cancel_order", "actions": _CANCEL_ACTIONS},
         )
-
-    for color in ["black", "blue", "white", "green", "navy"]:
-        for size in ["M", "L", "10"]:
-            cases.append(
-                {
-                    "message": f"remember I like {color} and my size is {size}",
-                    "intent": "save_preference",
-                    "actions": ["save_preference"],
-                }
-            )
-
-    for price in [90, 110, 130, 150, 170, 190, 210, 230, 250, 270, 290, 310, 330, 350, 370]:
-        cases.append(
-            {
-                "message": f"under {price}",
-                "context": {"recent": [{"intent": "product_search", "agent": "product"}]},
-                "intent": "product_search",
-                "actions": ["search_products"],
-            }
+    ]
+    cases += [
+        case
+        for ticket_idx in ticket_ids
+        for case in (
+            {"message": f"ticket status ticket_{ticket_idx}", "intent": "support_status", "actions": _TICKET_STATUS_ACTIONS},
+            {"message": f"close ticket ticket_{ticket_idx}", "intent": "support_close", "actions": _CLOSE_TICKET_ACTIONS},
         )
+    ]
+    cases += [
+        {
+            "message": f"remember I like {color} and my size is {size}",
+            "intent": "save_preference",
+            "actions": _PREFERENCE_ACTIONS,
+        }
+        for color in ["black", "blue", "white", "green", "navy"]
+        for size in ["M", "L", "10"]
+    ]
+    cases += [
+        {
+            "message": f"under {price}",
+            "context": _PRICE_REFINEMENT_CONTEXT,
+            "intent": "product_search",
+            "actions": _SEARCH_ACTIONS,
+        }
+        for price in [90, 110, 130, 150, 170, 190, 210, 230, 250, 270, 290, 310, 330, 350, 370]
+    ]
 
-    for _ in range(10):
-        cases.append(
-            {
-                "message": "show my cart and order status",
-                "intent": "multi_status",
-                "actions": ["get_cart", "get_order_status"],
-            }
-        )
-        cases.append(
-            {
-                "message": "show me cart",
-                "intent": "view_cart",
-                "actions": ["get_cart"],
-            }
-        )
-        cases.append(
-            {
-                "message": "please empty my cart",
-                "intent": "clear_cart",
-                "actions": ["clear_cart"],
-            }
-        )
-        cases.append(
-            {
-                "message": "checkout",
-                "intent": "checkout",
-                "actions": ["checkout_summary"],
-            }
-        )
+    cases.extend(_REPEATED_CASES * 10)
 
     return cases
 
@@ -149,14 +109,26 @@ def _build_eval_cases() -> list[dict[str, Any]]:
 CASES = _build_eval_cases()
 
 
-def test_nl_eval_accuracy_gate() -> None:
-    classifier = IntentClassifier()
-    extractor = ActionExtractor()
+def _case_key(case: dict[str, Any]) -> tuple[Any, ...]:
+    context = case.get("context")
+    context_key = orjson.dumps(context, option=orjson.OPT_SORT_KEYS) if context else b""
+    return (case["message"], context_key, case["intent"], tuple(case["actions"]))
+
 
+def test_nl_eval_accuracy_gate(classifier: IntentClassifier, extractor: ActionExtractor) -> None:
     intent_correct = 0
     action_correct = 0
 
+    # classify/extract are pure functions of (message, context), so score each
+    # distinct case once and weight it by how often it repeats in CASES.
+    counts: Counter[tuple[Any, ...]] = Counter()
+    representatives: dict[tuple[Any, ...], dict[str, Any]] = {}
     for case in CASES:
+        key = _case_key(case)
+        counts[key] += 1
+        representatives.setdefault(key, case)
+
+    for key, case in representatives.items():
         message = str(case["message"])
         context = case.get("context")
         expected_intent = str(case["intent"])
@@ -167,9 +139,9 @@ def test_nl_eval_accuracy_gate() -> None:
         action_names = [action.name for action in actions]
 
         if result.name == expected_intent:
-            intent_correct += 1
+            intent_correct += counts[key]
         if action_names == expected_actions:
-            action_correct += 1
+            action_correct += counts[key]
 
     total = len(CASES)
     assert total >= 200
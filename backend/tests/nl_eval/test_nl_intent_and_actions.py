@@ -154,10 +154,11 @@ CASES: list[dict[str, Any]] = [
 
 
 @pytest.mark.parametrize("case", CASES, ids=[case["id"] for case in CASES])
-def test_nl_intent_and_action_eval(case: dict[str, Any]) -> None:
-    classifier = IntentClassifier()
-    extractor = ActionExtractor()
-
+def test_nl_intent_and_action_eval(
+    case: dict[str, Any],
+    classifier: IntentClassifier,
+    extractor: ActionExtractor,
+) -> None:
     message = str(case["message"])
     context = case.get("context")
     result = classifier.classify(message=message, context=context)
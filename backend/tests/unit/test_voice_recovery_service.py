@@ -38,7 +38,14 @@ class _FakeMongoCollection:
         def match_doc(doc, f):
             if not f: return True
             for k, v in f.items():
-                if doc.get(k) != v: return False
+                if isinstance(v, dict) and "$in" in v:
+                    if doc.get(k) not in v["$in"]: return False
+                elif isinstance(v, dict) and ({"$gte", "$lt", "$lte"} & v.keys()):
+                    if doc.get(k) is None: return False
+                    if "$gte" in v and doc.get(k) < v["$gte"]: return False
+                    if "$lt" in v and doc.get(k) >= v["$lt"]: return False
+                    if "$lte" in v and doc.get(k) > v["$lte"]: return False
+                elif doc.get(k) != v: return False
             return True
         results = [deepcopy(doc) for doc in self.docs if match_doc(doc, filter)]
         class FakeCursor(list):
@@ -70,6 +77,11 @@ class _FakeMongoCollection:
         class Res: inserted_id = doc.get("id", "new")
         return Res()
 
+    def insert_many(self, docs: list[dict[str, Any]], ordered: bool = True) -> Any:
+        self.docs.extend(docs)
+        class Res: inserted_ids = [doc.get("id", "new") for doc in docs]
+        return Res()
+
     def update_one(self, filter, update, upsert=False):
         found_idx = -1
         def match_doc(d, f):
@@ -91,6 +103,8 @@ class _FakeMongoCollection:
         elif found_idx != -1:
             if "$set" in update:
                 self.docs[found_idx].update(deepcopy(update["$set"]))
+            for field, value in update.get("$push", {}).items():
+                self.docs[found_idx].setdefault(field, []).append(deepcopy(value))
             class ResMatch: matched_count = 1; upserted_id = None
             return ResMatch()
         class ResNoMatch: matched_count = 0; upserted_id = None
@@ -102,6 +116,13 @@ class _FakeMongoCollection:
         return Res()
     def count_documents(self, filter):
         return len(self.find(filter))
+    def aggregate(self, pipeline):
+        rows = self.find(pipeline[0]["$match"])
+        field = pipeline[1]["$group"]["_id"].lstrip("$")
+        counts: dict[Any, int] = {}
+        for row in rows:
+            counts[row.get(field)] = counts.get(row.get(field), 0) + 1
+        return [{"_id": key, "count": count} for key, count in counts.items()]
 
 class _FakeDatabase:
     def __init__(self) -> None:
@@ -321,3 +342,133 @@ def test_voice_recovery_ingests_provider_callback_idempotently() -> None:
     second = service.ingest_provider_callback(payload=payload)
     assert second["accepted"] is True
     assert second["idempotent"] is True
+
+
+class _SuperURecordingPolls(_SuperUSuccess):
+    def __init__(self) -> None:
+        self.polled_call_ids: list[str] = []
+    def fetch_call_logs(self, **kwargs: Any) -> list[dict[str, Any]]:
+        self.polled_call_ids.append(str(kwargs.get("call_id")))
+        return []
+
+
+def test_voice_recovery_skips_all_work_when_disabled() -> None:
+    superu = _SuperURecordingPolls()
+    service = _service(superu_client=superu)
+    due_at = (utc_now() - timedelta(minutes=5)).isoformat()
+    service.voice_repository.upsert_job(
+        {
+            "id": "vjob_due",
+            "status": "queued",
+            "userId": "user_due",
+            "sessionId": "session_due",
+            "cartId": "cart_due",
+            "recoveryKey": "cart_due::key",
+            "attempt": 0,
+            "nextRunAt": due_at,
+            "lastError": None,
+            "createdAt": due_at,
+            "updatedAt": due_at,
+        }
+    )
+    service.voice_repository.upsert_call(
+        {
+            "id": "vcall_active",
+            "status": "in_progress",
+            "providerCallId": "superu_call_active",
+            "createdAt": iso_now(),
+        }
+    )
+    service.update_settings({"enabled": False})
+
+    result = service.process_due_work()
+
+    assert result["settingsEnabled"] is False
+    assert result["enqueued"] == 0
+    assert sum(result["processed"].values()) == 0
+    assert result["polled"] == 0
+    # In-flight calls are not polled while recovery is disabled.
+    assert superu.polled_call_ids == []
+    assert service.voice_repository.get_job("vjob_due")["status"] == "queued"
+    assert service.list_alerts(limit=50) == []
+
+
+def test_voice_recovery_stats_count_only_todays_calls() -> None:
+    service = _service(superu_client=_SuperUSuccess())
+    yesterday = (utc_now() - timedelta(days=1)).isoformat()
+    for call_id, status, created_at in (
+        ("vcall_a", "completed", iso_now()),
+        ("vcall_b", "failed", iso_now()),
+        ("vcall_c", "skipped", iso_now()),
+        ("vcall_d", "completed", yesterday),
+    ):
+        service.voice_repository.upsert_call({"id": call_id, "status": status, "createdAt": created_at})
+
+    stats = service.stats()
+    assert stats["totalCalls"] == 4
+    assert stats["callsToday"] == 3
+    assert stats["completedToday"] == 1
+    assert stats["failedToday"] == 1
+    assert stats["suppressedToday"] == 1
+
+
+def test_voice_guardrails_count_todays_calls_per_user() -> None:
+    from app.services.voice.guardrails import DailyCallCounts, budget_and_cap_guardrails
+    from app.services.voice.settings import VoiceSettings
+
+    service = _service(superu_client=_SuperUSuccess())
+    yesterday = (utc_now() - timedelta(days=1)).isoformat()
+    service.voice_repository.upsert_call({"id": "vcall_1", "userId": "user_a", "createdAt": iso_now()})
+    service.voice_repository.upsert_call({"id": "vcall_2", "userId": "user_a", "createdAt": yesterday})
+    settings = VoiceSettings(max_calls_per_day=10, max_calls_per_user_per_day=1, daily_budget_usd=100.0)
+
+    daily_counts = DailyCallCounts(voice_repository=service.voice_repository, now=utc_now())
+
+    assert (
+        budget_and_cap_guardrails(user_id="user_a", settings=settings, daily_counts=daily_counts)
+        == "max_calls_per_user_per_day_reached"
+    )
+    assert budget_and_cap_guardrails(user_id="user_b", settings=settings, daily_counts=daily_counts) == "ok"
+
+    daily_counts.record("user_b")
+    assert daily_counts.total == 2
+    assert (
+        budget_and_cap_guardrails(user_id="user_b", settings=settings, daily_counts=daily_counts)
+        == "max_calls_per_user_per_day_reached"
+    )
+
+
+def test_voice_recovery_skips_carts_followed_by_newer_order() -> None:
+    service = _service(superu_client=_SuperUSuccess())
+    cart = service.cart_repository.list_all()[0]
+    service.order_repository.create(
+        {"id": "order_1", "userId": cart["userId"], "createdAt": iso_now()}
+    )
+
+    result = service.process_due_work()
+    assert result["enqueued"] == 0
+
+
+class _SuperUPollingLogs:
+    enabled = True
+    def start_outbound_call(self, **_kwargs: Any) -> dict[str, Any]:
+        return {"call_id": "superu_call_123", "status": "queued"}
+    def fetch_call_logs(self, *, call_id: str | None = None, **_kwargs: Any) -> list[dict[str, Any]]:
+        if call_id == "superu_broken":
+            raise RuntimeError("provider timeout")
+        return [{"call_id": call_id, "status": "completed", "outcome": "converted"}]
+
+
+def test_voice_recovery_polls_active_calls_and_alerts_on_failures() -> None:
+    service = _service(superu_client=_SuperUPollingLogs())
+    service.voice_repository.upsert_call(
+        {"id": "vcall_ok", "status": "initiated", "providerCallId": "superu_ok", "createdAt": iso_now()}
+    )
+    service.voice_repository.upsert_call(
+        {"id": "vcall_broken", "status": "ringing", "providerCallId": "superu_broken", "createdAt": iso_now()}
+    )
+
+    assert service._poll_provider_updates(now=utc_now()) == 1
+    assert service.voice_repository.get_call("vcall_ok")["status"] == "completed"
+    assert service.voice_repository.get_call("vcall_broken")["status"] == "ringing"
+    assert any(alert["code"] == "VOICE_POLL_FAILED" for alert in service.list_alerts(limit=10))